@@ -1,7 +1,6 @@
 import os, logging
 from os.path import basename, dirname, isdir
 import hashlib, io
-import checksumdir
 import utils
 
 from spdx.document import ExternalDocumentRef, Document, License, ExtractedLicense
@@ -11,6 +10,7 @@ from spdx.version import Version
 from spdx.package import Package
 from spdx.creationinfo import Tool
 from spdx.file import File
+from spdx.writers.tagvalue import write_document as write_tv_document
 
 
 class SPDXFile(object):
@@ -30,38 +30,46 @@ class SPDXFile(object):
         self.code_extra_params = utils.get_codebase_extra_params(self.path_or_file)
         self.full_file_path = None
         self.spdx_document = None
+        # SHA1 digests by file name, filled by get_package_verification_code
+        self.file_hashes = {}
 
     def get_package_version(self):
         return utils.get_package_version(self.path_or_file)
 
     def get_package_verification_code(self):
-        verificationcode = 0
-        filelist = ""
-        templist = []
-        for item in self.id_scan_results:
-            if not utils.should_skip_file(item["FileName"], self.output_file_name):
-                templist.append(utils.get_file_hash(item["FileName"]))
+        file_names = [
+            item["FileName"]
+            for item in self.id_scan_results
+            if not utils.should_skip_file(item["FileName"], self.output_file_name)
+        ]
+        templist = utils.get_file_hashes(file_names)
+        # kept for the file entries, so their paths are not stat'ed again
+        self.file_hashes = dict(zip(file_names, templist))
         # sort the sha values
-        templist.sort()
+        templist = sorted(templist)
+        verificationcode = hashlib.sha1()
         for item in templist:
-            filelist = "{0}{1}".format(filelist, item)
-        verificationcode = hashlib.sha1(filelist.encode())
+            verificationcode.update(item.encode())
         return verificationcode.hexdigest()
 
     def get_package_checksum(self):
         sha1hash = None
         if not self.is_file:
-            sha1hash = checksumdir.dirhash(self.path_or_file, "sha1")
+            sha1hash = utils.get_dir_hash(self.path_or_file)
         else:
-            h = hashlib.sha1()
             # open file for reading in binary mode
             with open(self.file_to_scan, "rb") as file:
-                # loop till the end of the file
-                chunk = 0
-                while chunk != b"":
-                    # read only 1024 bytes at a time
-                    chunk = file.read(1024)
-                    h.update(chunk)
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: hashing stays inside hashlib's C core
+                    h = hashlib.file_digest(file, "sha1")
+                else:
+                    h = hashlib.sha1()
+                    buf = memoryview(bytearray(1 << 20))
+                    # read 1 MiB at a time into a reusable buffer
+                    n = file.readinto(buf)
+                    while n:
+                        h.update(buf[:n])
+                        n = file.readinto(buf)
             # return the hex representation of digest
             sha1hash = h.hexdigest()
         return sha1hash
@@ -115,13 +123,12 @@ class SPDXFile(object):
 
     def set_package_info(self, package):
         # Use a set of unique copyrights for the package.
-        package.name = basename(self.path_or_file)
+        base_name = basename(self.path_or_file)
+        package.name = base_name
         if self.path_or_file == ".":
-            package.name = os.getcwd().split("/")[-1]
+            package.name = basename(os.getcwd())
         if self.file_to_scan:
-            package.name = "{0}/{1}".format(
-                basename(self.path_or_file), basename(self.file_to_scan)
-            )
+            package.name = "{0}/{1}".format(base_name, basename(self.file_to_scan))
 
         package.check_sum = Algorithm("SHA1", self.get_package_checksum())
 
@@ -134,6 +141,18 @@ class SPDXFile(object):
         package.license_declared = NoAssert()
         package.cr_text = SPDXNone()
 
+    def get_tv_file_license(self, file_data, package):
+        return License.from_identifier(file_data["SPDXID"])
+
+    def get_rdf_file_license(self, file_data, package):
+        spdx_license = ExtractedLicense("SPDXID-Doc-Generator-" + file_data["SPDXID"])
+        spdx_license.name = NoAssert()
+        spdx_license.comment = "N/A"
+        spdx_license.text = NoAssert()
+        self.spdx_document.add_extr_lic(spdx_license)
+        package.add_lics_from_file(spdx_license)
+        return spdx_license
+
     def create_spdx_document(self):
         """
         Write identifier scan results as SPDX Tag/value or RDF.
@@ -159,48 +178,38 @@ class SPDXFile(object):
         self.set_package_info(package)
         all_files_have_no_license = True
         all_files_have_no_copyright = True
-        file_license_list = []
-        file_license_ids = []
+        # unique file licenses keyed by identifier, in first-seen order
+        file_licenses = {}
         if utils.is_dir(self.path_or_file):
+            if self.doc_type == utils.TAG_VALUE:
+                get_file_license = self.get_tv_file_license
+            else:
+                get_file_license = self.get_rdf_file_license
+            file_ref = self.code_extra_params["file_ref"]
+            prefix_len = len(self.path_or_file)
             for idx, file_data in enumerate(self.id_scan_results):
-                file_data_instance = open(file_data["FileName"], "r")
                 if not utils.should_skip_file(
                     file_data["FileName"], self.output_file_name
                 ):
-                    name = file_data["FileName"].replace(self.path_or_file, ".")
+                    file_name = name = file_data["FileName"]
+                    # report files under the package relative to it
+                    if name.startswith(self.path_or_file):
+                        name = "." + name[prefix_len:]
+                    sha1hash = self.file_hashes.get(file_name)
+                    if sha1hash is None:
+                        sha1hash = utils.get_file_hash(file_name)
                     file_entry = File(
-                        name=name,
-                        chk_sum=Algorithm(
-                            "SHA1", utils.get_file_hash(file_data["FileName"]) or ""
-                        ),
+                        name=name, chk_sum=Algorithm("SHA1", sha1hash or "")
                     )
-                    spdx_license = None
-                    if self.doc_type == utils.TAG_VALUE:
-                        spdx_license = License.from_identifier(file_data["SPDXID"])
-                    else:
-                        licenseref_id = "SPDXID-Doc-Generator-" + file_data["SPDXID"]
-                        file_license_ids.append(licenseref_id)
-                        if licenseref_id in file_license_ids:
-                            spdx_license = ExtractedLicense(licenseref_id)
-                        spdx_license.name = NoAssert()
-                        comment = "N/A"
-                        spdx_license.comment = comment
-                        text = NoAssert()
-                        if not text:
-                            text = comment
-                        spdx_license.text = text
-                        self.spdx_document.add_extr_lic(spdx_license)
-                        package.add_lics_from_file(spdx_license)
+                    spdx_license = get_file_license(file_data, package)
                     file_entry.add_lics(spdx_license)
-                    file_license_list.append(spdx_license)
+                    file_licenses.setdefault(spdx_license.identifier, spdx_license)
                     file_entry.conc_lics = NoAssert()
                     file_entry.copyright = SPDXNone()
-                    file_entry.spdx_id = self.code_extra_params["file_ref"].format(
-                        idx + 1
-                    )
+                    file_entry.spdx_id = file_ref.format(idx + 1)
                     package.add_file(file_entry)
             if self.doc_type == utils.TAG_VALUE:
-                for spdx_license in list(set(file_license_list)):
+                for spdx_license in file_licenses.values():
                     package.add_lics_from_file(spdx_license)
 
         if len(package.files) == 0:
@@ -214,20 +223,21 @@ class SPDXFile(object):
                 )
 
         if self.doc_type == utils.TAG_VALUE:
-            from spdx.writers.tagvalue import write_document  # NOQA
+            write_document = write_tv_document
         else:
+            # rdflib is only required for RDF output
             from spdx.writers.rdf import write_document  # NOQA
 
         if package.files:
-            spdx_output = io.StringIO()
             if self.doc_type == utils.TAG_VALUE:
+                # encode the writer's text output straight into the output file
+                spdx_output = io.TextIOWrapper(
+                    self.output_file, encoding="utf-8", newline="\n"
+                )
                 write_document(self.spdx_document, spdx_output, validate=False)
+                spdx_output.detach()
                 logging.info("SPDX Tag-Value Document created successfully.")
             else:
-                # spdx_output = io.BytesIO()
-                write_document(self.spdx_document, spdx_output, validate=False)
+                # rdflib serializes to utf-8 bytes itself
+                write_document(self.spdx_document, self.output_file, validate=False)
                 logging.info("SPDX RDF Document created successfully.")
-            result = spdx_output.getvalue()
-            if self.doc_type == utils.TAG_VALUE:
-                result = result.encode("utf-8")
-            self.output_file.write(result)
@@ -1,9 +1,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import logging
+import mmap
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 import utils
 
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError:
+    # the resource module is not available on Windows
+    getrusage = None
+
 
 class ScanData(object):
     def __init__(self):
@@ -17,25 +28,39 @@ class ScanData(object):
         return self.license
 
 
+def walk_files(top):
+    """
+    Yield os.DirEntry objects for all files within top or its children,
+    without descending into HIDE_DIRECTORIES or symlinked directories.
+    """
+    stack = [top]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in utils.HIDE_DIRECTORIES:
+                        stack.append(entry.path)
+                elif not entry.is_dir():
+                    yield entry
+
+
 def get_list_of_all_files_in_all_deps(dirName):
     """Returns a list of all paths for all files within topDir or its children."""
-    # create a list of file and sub directories
-    # names in the given directory
-    listOfFile = os.listdir(dirName)
-    allFiles = list()
-    # Iterate over all the entries
-    for entry in listOfFile:
-        # Create full path
-        fullPath = os.path.join(dirName, entry)
-        # If entry is a directory then get the list of files in this directory
-        if os.path.isdir(fullPath):
-            if not entry in utils.HIDE_DIRECTORIES:
-                allFiles = allFiles + getListOfFiles(fullPath)
-        else:
-            if not entry in utils.IGNORE_FILENAMES:
-                allFiles.append(fullPath)
+    return [
+        entry.path
+        for entry in walk_files(dirName)
+        if entry.name not in utils.IGNORE_FILENAMES
+    ]
+
 
-    return allFiles
+# matches paths inside any of utils.SKIP_DIRECTORIES
+SKIP_DIRECTORIES_RE = re.compile(
+    "|".join(re.escape(f"/{d}/") for d in sorted(utils.SKIP_DIRECTORIES))
+)
 
 
 def skip_directory(dir_list, filePath):
@@ -64,51 +89,102 @@ def should_skip_file(filePath, glob_to_skip):
     _, extension = os.path.splitext(filePath)
     if extension in utils.SKIP_EXTENSIONS:
         return (True, "skipped file extension")
-    skip_directory(utils.SKIP_DIRECTORIES, filePath)
+    if SKIP_DIRECTORIES_RE.search(filePath):
+        return (True, "skipped directory")
     return (False, "")
 
 
 def get_dependencies_file_paths(dep_path_list):
     """
     Return a list of path strings for all the installed python package files
-    given a dep_path_list list of directories path of installed python packages
+    given a dep_path_list list of directories path (or os.DirEntry objects)
+    of installed python packages
     """
     logging.basicConfig(level=logging.INFO)
     logging.info("Getting dependencies file paths")
-    dep_path_list1 = ["/home/philip/Desktop/tests/bitbake"]
     dep_file_list = []  # installed_files
     for item in dep_path_list:
-        if os.path.isfile(item):
-            dep_file_list.append(item)
+        # os.DirEntry items, as returned by get_dependencies, know their type
+        if isinstance(item, os.DirEntry):
+            is_file = item.is_file()
+        else:
+            is_file = os.path.isfile(item)
+        if is_file:
+            dep_file_list.append(os.fspath(item))
         else:
-            for (currentDir, _, filenames) in os.walk(item):
-                for item in utils.HIDE_DIRECTORIES:
-                    if item in currentDir:
-                        continue  # Clear
-                    else:
-                        for filename in filenames:
-                            filebasename, file_extension = os.path.splitext(filename)
-                            if (
-                                filename not in utils.IGNORE_FILENAMES
-                                and file_extension not in utils.SKIP_EXTENSIONS
-                            ):
-                                p = os.path.join(currentDir, filename)  # current_dir
-                                dep_file_list.append(p)
+            for entry in walk_files(item):
+                _, file_extension = os.path.splitext(entry.name)
+                if (
+                    entry.name not in utils.IGNORE_FILENAMES
+                    and file_extension not in utils.SKIP_EXTENSIONS
+                ):
+                    dep_file_list.append(entry.path)
     return dep_file_list
 
 
-def parseLineForIdentifier(line):
+IDENTIFIER_TAG = b"SPDX-License-Identifier:"
+
+# number of bytes read at a time while looking for the first numLines lines
+HEAD_CHUNK_SIZE = 16 * 1024
+
+
+def _read_file_head(f, numLines):
+    chunks = []
+    newlines = 0
+    while newlines < numLines:
+        chunk = f.read(HEAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+    return b"".join(chunks)
+
+
+def _head_end(buf, numLines):
+    """Return the offset just past the numLines-th line of buf."""
+    end = -1
+    for _ in range(numLines):
+        end = buf.find(b"\n", end + 1)
+        if end < 0:
+            return len(buf)
+    return end + 1
+
+
+def get_file_head(f, numLines):
     """
-    Return parsed SPDX expression if tag found in line, or None otherwise.
+    Return the first numLines lines of the binary file object f as bytes,
+    or the entire file if numLines is 0.
+    The file is memory mapped so only the pages holding those lines are read.
     """
-    p = line.partition("SPDX-License-Identifier:")
-    if p[2] == "":
-        return None
+    if numLines <= 0:
+        return f.read()
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # empty files and special files cannot be mapped
+        head = _read_file_head(f, numLines)
+        return head[: _head_end(head, numLines)]
+    with mm:
+        return mm[: _head_end(mm, numLines)]
+
+
+def parseHeadForIdentifier(head):
+    """
+    Return (parsed SPDX expression, line number) for the first tag found in
+    the head bytes, or (None, -1) otherwise.
+    """
+    idx = head.find(IDENTIFIER_TAG)
+    if idx < 0:
+        return None, -1
+    start = idx + len(IDENTIFIER_TAG)
+    end = head.find(b"\n", start)
+    if end < 0:
+        end = len(head)
+        if start == end:
+            return None, -1
     # strip away trailing comment marks and whitespace, if any
-    identifier = p[2].strip()
-    identifier = identifier.rstrip("/*")
-    identifier = identifier.strip()
-    return identifier
+    identifier = head[start:end].strip().rstrip(b"/*").strip()
+    return identifier.decode("utf-8"), head.count(b"\n", 0, idx) + 1
 
 
 def get_identifier_data(filePath, glob_to_skip, numLines=20):
@@ -145,37 +221,36 @@ def get_identifier_data(filePath, glob_to_skip, numLines=20):
     # if we get here, we will scan the file
     sd.scanned = True
     logging.debug(f"Scanning {filePath}")
-    with open(filePath, "r") as f:
-        try:
-            lineno = 0
-            for line in f:
-                lineno += 1
-                if numLines > 0 and lineno > numLines:
-                    break
-                identifier = parseLineForIdentifier(line)
-                if identifier is not None:
-                    sd.license = identifier
-                    sd.lineno = lineno
-                    return {
-                        "FileName": filePath,
-                        "SPDXID": sd.license,
-                        "scanned": sd.scanned,
-                        "FileType": None,
-                        "FileChecksum": None,
-                    }
-        except UnicodeDecodeError:
-            # invalid UTF-8 content
-            sd.scanned = False
-            sd.skipReason = "encountered invalid UTF-8 content"
-            sd.license = "SKIPPED"
-            sd.lineno = -1
-            return {
-                "FileName": filePath,
-                "SPDXID": sd.license,
-                "scanned": sd.scanned,
-                "FileType": None,
-                "FileChecksum": None,
-            }
+    with open(filePath, "rb") as f:
+        head = get_file_head(f, numLines)
+    try:
+        # ASCII is valid UTF-8, so only decode heads with non-ASCII bytes
+        if not head.isascii():
+            head.decode("utf-8")
+    except UnicodeDecodeError:
+        # invalid UTF-8 content
+        sd.scanned = False
+        sd.skipReason = "encountered invalid UTF-8 content"
+        sd.license = "SKIPPED"
+        sd.lineno = -1
+        return {
+            "FileName": filePath,
+            "SPDXID": sd.license,
+            "scanned": sd.scanned,
+            "FileType": None,
+            "FileChecksum": None,
+        }
+    identifier, lineno = parseHeadForIdentifier(head)
+    if identifier is not None:
+        sd.license = identifier
+        sd.lineno = lineno
+        return {
+            "FileName": filePath,
+            "SPDXID": sd.license,
+            "scanned": sd.scanned,
+            "FileType": None,
+            "FileChecksum": None,
+        }
 
     # if we get here, we didn't find an identifier
     sd.license = None
@@ -207,8 +282,18 @@ def get_identifiers_for_paths(paths, glob_to_skip, numLines=20):
     logging.info("Getting identifiers for paths")
     scan_metrics = {"with_id": 0, "without_id": 0, "skipped": 0, "total": len(paths)}
     results = []
-    for filePath in paths:
-        id_data = get_identifier_data(filePath, glob_to_skip, numLines)
+    # every file is scanned independently, so spread them over all cores
+    with ProcessPoolExecutor() as executor:
+        all_id_data = list(
+            executor.map(
+                functools.partial(
+                    get_identifier_data, glob_to_skip=glob_to_skip, numLines=numLines
+                ),
+                paths,
+                chunksize=128,
+            )
+        )
+    for id_data in all_id_data:
         if id_data["SPDXID"] == "SKIPPED":
             scan_metrics["skipped"] = scan_metrics["skipped"] + 1
         if id_data["SPDXID"] == "NOASSERTION":
@@ -220,25 +305,33 @@ def get_identifiers_for_paths(paths, glob_to_skip, numLines=20):
     return results
 
 
-def get_complete_time(function, args=tuple(), kwargs={}):
+def get_complete_time(function):
     """
     ----Decorator----
-    Get real, user and system time
+    Log real, user and system time
     """
 
+    @functools.wraps(function)
     def wrappedMethod(*args, **kwargs):
-        from time import time as timestamp
-        from resource import getrusage as resource_usage, RUSAGE_SELF
-
-        start_time, start_resources = timestamp(), resource_usage(RUSAGE_SELF)
+        start_time = perf_counter()
+        start_resources = getrusage(RUSAGE_SELF) if getrusage else None
         func = function(*args, **kwargs)
-        end_resources, end_time = resource_usage(RUSAGE_SELF), timestamp()
-        results = {
-            "real": end_time - start_time,
-            "sys": end_resources.ru_stime - start_resources.ru_stime,
-            "user": end_resources.ru_utime - start_resources.ru_utime,
-        }
-        # print("Execution time for {0}".format(function.__name__))
+        end_resources = getrusage(RUSAGE_SELF) if getrusage else None
+        end_time = perf_counter()
+        if start_resources:
+            logging.info(
+                "Execution time for %s: real %.3fs, user %.3fs, sys %.3fs",
+                function.__name__,
+                end_time - start_time,
+                end_resources.ru_utime - start_resources.ru_utime,
+                end_resources.ru_stime - start_resources.ru_stime,
+            )
+        else:
+            logging.info(
+                "Execution time for %s: real %.3fs",
+                function.__name__,
+                end_time - start_time,
+            )
         return func
 
     return wrappedMethod
@@ -17,6 +17,8 @@ from __future__ import unicode_literals
 
 class Algorithm(object):
     """Generic checksum algorithm."""
+    __slots__ = ('identifier', 'value')
+
     def __init__(self, identifier, value):
         self.identifier = identifier
         self.value = value
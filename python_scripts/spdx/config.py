@@ -14,9 +14,18 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import codecs
-import json
+import mmap
 import os
+import pickle
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def json_loads(data):
+        # the json module does not accept memoryviews
+        return _json_loads(bytes(data))
 
 from spdx.version import Version
 
@@ -25,23 +34,30 @@ _licenses = os.path.join(_base_dir, 'licenses.json')
 _exceptions = os.path.join(_base_dir, 'exceptions.json')
 
 
+def load_json(file_name):
+    """
+    Return the object decoded from the JSON file file_name, parsed directly
+    from a read-only memory map of the file.
+    """
+    with open(file_name, 'rb') as json_file:
+        with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with memoryview(data) as view:
+                return json_loads(view)
+
+
 def load_license_list(file_name):
     """
     Return the licenses list version tuple and a mapping of licenses
     name->id and id->name loaded from a JSON file
     from https://github.com/spdx/license-list-data
     """
-    licenses_map = {}
-    with codecs.open(file_name, 'rb', encoding='utf-8') as lics:
-        licenses = json.load(lics)
-        version = licenses['licenseListVersion'].split('.')
-        for lic in licenses['licenses']:
-            if lic.get('isDeprecatedLicenseId'):
-                continue
-            name = lic['name']
-            identifier = lic['licenseId']
-            licenses_map[name] = identifier
-            licenses_map[identifier] = name
+    licenses = load_json(file_name)
+    version = licenses['licenseListVersion'].split('.')
+    entries = [(lic['name'], lic['licenseId'])
+               for lic in licenses['licenses']
+               if not lic.get('isDeprecatedLicenseId')]
+    licenses_map = dict(entries)
+    licenses_map.update((identifier, name) for name, identifier in entries)
     return version, licenses_map
 
 
@@ -51,22 +67,46 @@ def load_exception_list(file_name):
     name->id and id->name loaded from a JSON file
     from https://github.com/spdx/license-list-data
     """
-    exceptions_map = {}
-    with codecs.open(file_name, 'rb', encoding='utf-8') as excs:
-        exceptions = json.load(excs)
-        version = exceptions['licenseListVersion'].split('.')
-        for exc in exceptions['exceptions']:
-            if exc.get('isDeprecatedLicenseId'):
-                continue
-            name = exc['name']
-            identifier = exc['licenseExceptionId']
-            exceptions_map[name] = identifier
-            exceptions_map[identifier] = name
+    exceptions = load_json(file_name)
+    version = exceptions['licenseListVersion'].split('.')
+    entries = [(exc['name'], exc['licenseExceptionId'])
+               for exc in exceptions['exceptions']
+               if not exc.get('isDeprecatedLicenseId')]
+    exceptions_map = dict(entries)
+    exceptions_map.update((identifier, name) for name, identifier in entries)
     return version, exceptions_map
 
 
-(_major, _minor), LICENSE_MAP = load_license_list(_licenses)
+def load_cached(file_name, loader):
+    """
+    Return loader(file_name), reusing a pickle of the result stored next to
+    file_name for as long as the file's modification time and size match.
+    """
+    cache_name = file_name + '.pickle'
+    stat = os.stat(file_name)
+    key = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(cache_name, 'rb') as cache:
+            cached_key, result = pickle.load(cache)
+        if cached_key == key:
+            return result
+    except Exception:
+        # missing, stale or unreadable cache: rebuild it below
+        pass
+    result = loader(file_name)
+    tmp_name = '{0}.{1}'.format(cache_name, os.getpid())
+    try:
+        with open(tmp_name, 'wb') as cache:
+            pickle.dump((key, result), cache, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_name)
+    except OSError:
+        # read-only installs simply go without a cache
+        pass
+    return result
+
+
+(_major, _minor), LICENSE_MAP = load_cached(_licenses, load_license_list)
 LICENSE_LIST_VERSION = Version(major=_major, minor=_minor)
 
-(_major, _minor), EXCEPTION_MAP = load_exception_list(_exceptions)
+(_major, _minor), EXCEPTION_MAP = load_cached(_exceptions, load_exception_list)
 EXCEPTION_LIST_VERSION = Version(major=_major, minor=_minor)
\ No newline at end of file
@@ -105,10 +105,7 @@ class License(object):
         the full_name is retrieved from it. Otherwise
         the full_name is the same as the identifier.
         """
-        if identifier in config.LICENSE_MAP.keys():
-            return cls(config.LICENSE_MAP[identifier], identifier)
-        else:
-            return cls(identifier, identifier)
+        return cls(config.LICENSE_MAP.get(identifier, identifier), identifier)
 
     @classmethod
     def from_full_name(cls, full_name):
@@ -117,7 +114,7 @@ class License(object):
         config.LICENSE_MAP the identifier is retrieved from it.
         Otherwise the identifier is the same as the full_name.
         """
-        if full_name in config.LICENSE_MAP.keys():
+        if full_name in config.LICENSE_MAP:
             return cls(full_name, config.LICENSE_MAP[full_name])
         else:
             return cls(full_name, full_name)
@@ -13,6 +13,8 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
+from sys import intern
+
 from ply import lex
 
 
@@ -98,35 +100,20 @@ class Lexer(object):
         'ARCHIVE': 'ARCHIVE',
         'OTHER': 'OTHER'
     }
-    states = (('text', 'exclusive'),)
-
     tokens = ['TEXT', 'TOOL_VALUE', 'UNKNOWN_TAG',
               'ORG_VALUE', 'PERSON_VALUE',
               'DATE', 'LINE', 'CHKSUM', 'DOC_REF_ID',
               'DOC_URI', 'EXT_DOC_REF_CHKSUM'] + list(reserved.values())
 
+    # The body is unrolled into runs of anything but '<' so the regex engine
+    # scans it in tight loops instead of trying </text> at every character.
     def t_text(self, t):
-        r':\s*<text>'
-        t.lexer.text_start = t.lexer.lexpos - len('<text>')
-        t.lexer.begin('text')
-
-    def t_text_end(self, t):
-        r'</text>\s*'
+        r':\s*<text>[^<]*(?:<(?!/text>)[^<]*)*</text>\s*'
         t.type = 'TEXT'
-        t.value = t.lexer.lexdata[
-            t.lexer.text_start:t.lexer.lexpos]
         t.lexer.lineno += t.value.count('\n')
-        t.value = t.value.strip()
-        t.lexer.begin('INITIAL')
+        t.value = t.value[1:].strip()
         return t
 
-    def t_text_any(self, t):
-        r'.|\n'
-        pass
-
-    def t_text_error(self, t):
-        print('Lexer error in text state')
-
     def t_CHKSUM(self, t):
         r':\s*SHA1:\s*[a-f0-9]{40,40}'
         t.value = t.value[1:].strip()
@@ -169,17 +156,16 @@ class Lexer(object):
 
     def t_KEYWORD_AS_TAG(self, t):
         r'[a-zA-Z]+'
+        # Interned, a known tag is the very string keying reserved, so the
+        # lookup and any later comparison short-circuit on identity.
+        t.value = intern(t.value)
         t.type = self.reserved.get(t.value, 'UNKNOWN_TAG')
-        t.value = t.value.strip()
         return t
 
     def t_LINE_OR_KEYWORD_VALUE(self, t):
         r':.+'
         t.value = t.value[1:].strip()
-        if t.value in self.reserved.keys():
-            t.type = self.reserved[t.value]
-        else:
-            t.type = 'LINE'
+        t.type = self.reserved.get(t.value, 'LINE')
         return t
 
     def t_comment(self, t):
@@ -194,8 +180,19 @@ class Lexer(object):
         r'\s+'
         pass
 
+    # lex.lex() validates every rule and compiles the master regex, so that is
+    # done once per set of options; later lexers clone the result.
+    _prototypes = {}
+
     def build(self, **kwargs):
-        self.lexer = lex.lex(module=self, **kwargs)
+        key = tuple(sorted(kwargs.items()))
+        prototype = Lexer._prototypes.get(key)
+        if prototype is None:
+            prototype = lex.lex(module=self, **kwargs)
+            Lexer._prototypes[key] = prototype
+        self.lexer = prototype.clone(self)
+        # clone() rebinds the rules per state; pick up the rebound ones
+        self.lexer.begin('INITIAL')
 
     def token(self):
         return self.lexer.token()
@@ -28,3 +28,25 @@ class FileLogger(object):
 
     def log(self, msg):
         self.dest.write(msg + '\n')
+
+
+class BufferedLogger(object):
+    """
+    Collect messages and pass them on to logger in batches, joined into a
+    single message per batch.
+    """
+
+    def __init__(self, logger, limit=256):
+        self.logger = logger
+        self.limit = limit
+        self.pending = []
+
+    def log(self, msg):
+        self.pending.append(msg)
+        if len(self.pending) >= self.limit:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.logger.log('\n'.join(self.pending))
+            self.pending = []
@@ -28,8 +28,15 @@ from spdx import document
 from spdx import utils
 from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import SPDXValueError
+from spdx.parsers.loggers import BufferedLogger
 
 
+# Shared instances of the stateless special values; every spdx:none,
+# spdx:noassertion and spdx:unknown node maps to the same object.
+_NO_ASSERT = utils.NoAssert()
+_SPDX_NONE = utils.SPDXNone()
+_UNKNOWN = utils.UnKnown()
+
 ERROR_MESSAGES = {
     'DOC_VERS_VALUE': 'Invalid specVersion \'{0}\' must be SPDX-M.N where M and N are numbers.',
     'DOC_D_LICS': 'Invalid dataLicense \'{0}\' must be http://spdx.org/licenses/CC0-1.0.',
@@ -63,6 +70,9 @@ ERROR_MESSAGES = {
                          'to the license, denoted by LicenseRef-[idstring] or spdx:noassertion or spdx:none.',
 }
 
+# Bound str.format of every message, so reporting is a single call.
+ERROR_FORMATTERS = dict((key, msg.format) for key, msg in ERROR_MESSAGES.items())
+
 
 class BaseParser(object):
     """
@@ -91,7 +101,7 @@ class BaseParser(object):
         bad_value - is passed to format which is called on what key maps to
         in ERROR_MESSAGES.
         """
-        msg = ERROR_MESSAGES[key].format(bad_value)
+        msg = ERROR_FORMATTERS[key](bad_value)
         self.logger.log(msg)
         self.error = True
 
@@ -100,11 +110,11 @@ class BaseParser(object):
         NONE, NOASSERTION or UNKNOWN if so returns proper model.
         else returns value"""
         if value == self.spdx_namespace.none:
-            return utils.SPDXNone()
+            return _SPDX_NONE
         elif value == self.spdx_namespace.noassertion:
-            return utils.NoAssert()
+            return _NO_ASSERT
         elif value == self.spdx_namespace.unknown:
-            return utils.UnKnown()
+            return _UNKNOWN
         else:
             return value
 
@@ -118,6 +128,18 @@ class LicenseParser(BaseParser):
 
     def __init__(self, builder, logger):
         super(LicenseParser, self).__init__(builder, logger)
+        self.license_cache = {}
+
+    def license_from_identifier(self, identifier):
+        """
+        Return the License for identifier, reusing the instance already
+        built for it while parsing the current document.
+        """
+        lic = self.license_cache.get(identifier)
+        if lic is None:
+            lic = document.License.from_identifier(identifier)
+            self.license_cache[identifier] = lic
+        return lic
 
     def handle_lics(self, lics):
         """
@@ -135,7 +157,7 @@ class LicenseParser(BaseParser):
             if special == lics:
                 if self.LICS_REF_REGEX.match(lics):
                     # Is a license ref i.e LicenseRef-1
-                    return document.License.from_identifier(lics)
+                    return self.license_from_identifier(lics)
                 else:
                     # Not a known license form
                     raise SPDXValueError('License')
@@ -144,7 +166,7 @@ class LicenseParser(BaseParser):
                 return special
         else:
             # license url
-            return document.License.from_identifier(lics[ident_start:])
+            return self.license_from_identifier(lics[ident_start:])
 
     def get_extr_license_ident(self, extr_lic):
         """
@@ -465,7 +487,7 @@ class PackageParser(LicenseParser):
         for _s, _p, o in self.graph.triples((p_term, predicate, None)):
             try:
                 if o == "NOASSERTION":
-                    self.builder.set_pkg_originator(self.doc, utils.NoAssert())
+                    self.builder.set_pkg_originator(self.doc, _NO_ASSERT)
                 else:
                     ent = self.builder.create_entity(self.doc, six.text_type(o))
                     self.builder.set_pkg_originator(self.doc, ent)
@@ -479,7 +501,7 @@ class PackageParser(LicenseParser):
         for _s, _p, o in self.graph.triples((p_term, predicate, None)):
             try:
                 if o == "NOASSERTION":
-                    self.builder.set_pkg_supplier(self.doc, utils.NoAssert())
+                    self.builder.set_pkg_supplier(self.doc, _NO_ASSERT)
                 else:
                     ent = self.builder.create_entity(self.doc, six.text_type(o))
                     self.builder.set_pkg_supplier(self.doc, ent)
@@ -916,51 +938,57 @@ class Parser(PackageParser, FileParser, SnippetParser, ReviewParser, AnnotationP
     """
 
     def __init__(self, builder, logger):
-        super(Parser, self).__init__(builder, logger)
+        # Batch messages the same way the tag/value parser does; parse()
+        # flushes whatever is left.
+        super(Parser, self).__init__(builder, BufferedLogger(logger))
 
     def parse(self, fil):
         """Parses a file and returns a document object.
         File, a file like object.
         """
         self.error = False
-        self.graph = Graph()
-        self.graph.parse(file=fil, format='xml')
-        self.doc = document.Document()
-
-        for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['SpdxDocument'])):
-            self.parse_doc_fields(s)
-
-        for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['ExternalDocumentRef'])):
-            self.parse_ext_doc_ref(s)
-
-        for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['CreationInfo'])):
-            self.parse_creation_info(s)
-
-        for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['Package'])):
-            self.parse_package(s)
-
-        for s, _p, o in self.graph.triples((None, self.spdx_namespace['referencesFile'], None)):
-            self.parse_file(o)
-
-        for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['Snippet'])):
-            self.parse_snippet(s)
-
-        for s, _p, o in self.graph.triples((None, self.spdx_namespace['reviewed'], None)):
-            self.parse_review(o)
-
-        for s, _p, o in self.graph.triples((None, self.spdx_namespace['annotation'], None)):
-            self.parse_annotation(o)
-
-        validation_messages = []
-        # Report extra errors if self.error is False otherwise there will be
-        # redundent messages
-        validation_messages = self.doc.validate(validation_messages)
-        if not self.error:
-            if validation_messages:
-                for msg in validation_messages:
-                    self.logger.log(msg)
-                self.error = True
-        return self.doc, self.error
+        self.license_cache = {}
+        try:
+            self.graph = Graph()
+            self.graph.parse(file=fil, format='xml')
+            self.doc = document.Document()
+
+            for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['SpdxDocument'])):
+                self.parse_doc_fields(s)
+
+            for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['ExternalDocumentRef'])):
+                self.parse_ext_doc_ref(s)
+
+            for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['CreationInfo'])):
+                self.parse_creation_info(s)
+
+            for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['Package'])):
+                self.parse_package(s)
+
+            for s, _p, o in self.graph.triples((None, self.spdx_namespace['referencesFile'], None)):
+                self.parse_file(o)
+
+            for s, _p, o in self.graph.triples((None, RDF.type, self.spdx_namespace['Snippet'])):
+                self.parse_snippet(s)
+
+            for s, _p, o in self.graph.triples((None, self.spdx_namespace['reviewed'], None)):
+                self.parse_review(o)
+
+            for s, _p, o in self.graph.triples((None, self.spdx_namespace['annotation'], None)):
+                self.parse_annotation(o)
+
+            # Only validate documents that parsed cleanly: otherwise the
+            # messages would repeat errors already reported, and they were
+            # never logged anyway.
+            if not self.error:
+                validation_messages = self.doc.validate([])
+                if validation_messages:
+                    for msg in validation_messages:
+                        self.logger.log(msg)
+                    self.error = True
+            return self.doc, self.error
+        finally:
+            self.logger.flush()
 
     def parse_creation_info(self, ci_term):
         """
@@ -26,7 +26,53 @@ from spdx.parsers import tagvaluebuilders
 from spdx.parsers import validations
 
 
+def _creation_info(builder, doc):
+    return doc.creation_info
+
+
+def _package(builder, doc):
+    builder.assert_package_exists()
+    return doc.package
+
+
+def _snippet(builder, doc):
+    builder.assert_snippet_exists()
+    return doc.snippet[-1]
+
+
+def once_setter(flag, attr, name, owner=None):
+    """
+    Return a builder method that sets `attr` on the object returned by
+    `owner(builder, doc)`, or on the document itself if owner is None.
+    The owner may raise OrderError if the object is not defined yet.
+    Raise CardinalityError(name) if the builder's `flag` is already set.
+    """
+    def setter(self, doc, value):
+        target = doc if owner is None else owner(self, doc)
+        if getattr(self, flag):
+            raise CardinalityError(name)
+        setattr(self, flag, True)
+        setattr(target, attr, value)
+        return True
+
+    setter.__doc__ = 'Sets {0}, raises CardinalityError if already set.'.format(
+        name)
+    return setter
+
+
+# Bits of DocBuilder.doc_fields_set, one per set-once document field.
+DOC_VERSION = 1 << 0
+DOC_COMMENT = 1 << 1
+DOC_NAMESPACE = 1 << 2
+DOC_DATA_LICS = 1 << 3
+DOC_NAME = 1 << 4
+DOC_SPDX_ID = 1 << 5
+
+
 class DocBuilder(object):
+    __slots__ = ()
+    FLAGS = ('doc_fields_set',)
+
     VERS_STR_REGEX = re.compile(r'SPDX-(\d+)\.(\d+)', re.UNICODE)
 
     def __init__(self):
@@ -40,8 +86,8 @@ class DocBuilder(object):
         - SPDXValueError if malformed value,
         - CardinalityError if already defined,
         """
-        if not self.doc_version_set:
-            self.doc_version_set = True
+        if not self.doc_fields_set & DOC_VERSION:
+            self.doc_fields_set |= DOC_VERSION
             m = self.VERS_STR_REGEX.match(value)
             if m is None:
                 raise SPDXValueError('Document::Version')
@@ -59,8 +105,8 @@ class DocBuilder(object):
         - SPDXValueError if malformed value,
         - CardinalityError if already defined.
         """
-        if not self.doc_data_lics_set:
-            self.doc_data_lics_set = True
+        if not self.doc_fields_set & DOC_DATA_LICS:
+            self.doc_fields_set |= DOC_DATA_LICS
             # TODO: what is this split?
             res_parts = res.split('/')
             if len(res_parts) != 0:
@@ -75,9 +121,9 @@ class DocBuilder(object):
         """
         Sets the document name, raises CardinalityError if already defined.
         """
-        if not self.doc_name_set:
+        if not self.doc_fields_set & DOC_NAME:
             doc.name = name
-            self.doc_name_set = True
+            self.doc_fields_set |= DOC_NAME
             return True
         else:
             raise CardinalityError('Document::Name')
@@ -87,10 +133,10 @@ class DocBuilder(object):
         Raises value error if malformed value, CardinalityError
         if already defined.
         """
-        if not self.doc_spdx_id_set:
+        if not self.doc_fields_set & DOC_SPDX_ID:
             if validations.validate_doc_spdx_id(doc_spdx_id_line):
                 doc.spdx_id = doc_spdx_id_line
-                self.doc_spdx_id_set = True
+                self.doc_fields_set |= DOC_SPDX_ID
                 return True
             else:
                 raise SPDXValueError('Document::SPDXID')
@@ -101,9 +147,10 @@ class DocBuilder(object):
         """Sets document comment, Raises CardinalityError if
         comment already set.
         """
-        if not self.doc_comment_set:
-            self.doc_comment_set = True
+        if not self.doc_fields_set & DOC_COMMENT:
+            self.doc_fields_set |= DOC_COMMENT
             doc.comment = comment
+            return True
         else:
             raise CardinalityError('Document::Comment')
 
@@ -112,30 +159,25 @@ class DocBuilder(object):
         Raise SPDXValueError if malformed value, CardinalityError
         if already defined.
         """
-        if not self.doc_namespace_set:
-            self.doc_namespace_set = True
+        if not self.doc_fields_set & DOC_NAMESPACE:
+            self.doc_fields_set |= DOC_NAMESPACE
             if validations.validate_doc_namespace(namespace):
                 doc.namespace = namespace
                 return True
             else:
                 raise SPDXValueError('Document::Namespace')
         else:
-            raise CardinalityError('Document::Comment')
+            raise CardinalityError('Document::Namespace')
 
     def reset_document(self):
         """
         Reset the internal state to allow building new document
         """
-        # FIXME: this state does not make sense
-        self.doc_version_set = False
-        self.doc_comment_set = False
-        self.doc_namespace_set = False
-        self.doc_data_lics_set = False
-        self.doc_name_set = False
-        self.doc_spdx_id_set = False
+        self.doc_fields_set = 0
 
 
 class ExternalDocumentRefBuilder(tagvaluebuilders.ExternalDocumentRefBuilder):
+    __slots__ = ()
 
     def set_chksum(self, doc, chk_sum):
         """
@@ -150,40 +192,53 @@ class ExternalDocumentRefBuilder(tagvaluebuilders.ExternalDocumentRefBuilder):
 
 
 class EntityBuilder(tagvaluebuilders.EntityBuilder):
+    __slots__ = ()
+    # Accepts exactly what tool_re, person_re or org_re accept, in one pass.
+    entity_re = re.compile(r'(?P<tool>Tool:\s*.)|(?P<person>Person:\s*[^(])'
+                           r'|(?P<org>Organization:\s*[^(])', re.UNICODE)
 
     def __init__(self):
         super(EntityBuilder, self).__init__()
 
     def create_entity(self, doc, value):
-        if self.tool_re.match(value):
+        match = self.entity_re.match(value)
+        if match is None:
+            raise SPDXValueError('Entity')
+        elif match.lastgroup == 'tool':
             return self.build_tool(doc, value)
-        elif self.person_re.match(value):
+        elif match.lastgroup == 'person':
             return self.build_person(doc, value)
-        elif self.org_re.match(value):
-            return self.build_org(doc, value)
         else:
-            raise SPDXValueError('Entity')
+            return self.build_org(doc, value)
 
 
 class CreationInfoBuilder(tagvaluebuilders.CreationInfoBuilder):
+    __slots__ = ()
+    set_creation_comment = once_setter(
+        'creation_comment_set', 'comment', 'CreationInfo::Comment',
+        _creation_info)
 
     def __init__(self):
         super(CreationInfoBuilder, self).__init__()
 
-    def set_creation_comment(self, doc, comment):
-        """Sets creation comment, Raises CardinalityError if
-        comment already set.
-        Raises SPDXValueError if not free form text.
-        """
-        if not self.creation_comment_set:
-            self.creation_comment_set = True
-            doc.creation_info.comment = comment
-            return True
-        else:
-            raise CardinalityError('CreationInfo::Comment')
-
 
 class PackageBuilder(tagvaluebuilders.PackageBuilder):
+    __slots__ = ()
+    set_pkg_source_info = once_setter(
+        'package_source_info_set', 'source_info', 'Package::SourceInfo',
+        _package)
+    set_pkg_verif_code = once_setter(
+        'package_verif_set', 'verif_code', 'Package::VerificationCode',
+        _package)
+    set_pkg_license_comment = once_setter(
+        'package_license_comment_set', 'license_comment',
+        'Package::LicenseComment', _package)
+    set_pkg_cr_text = once_setter(
+        'package_cr_text_set', 'cr_text', 'Package::CopyrightText', _package)
+    set_pkg_summary = once_setter(
+        'package_summary_set', 'summary', 'Package::Summary', _package)
+    set_pkg_desc = once_setter(
+        'package_desc_set', 'description', 'Package::Description', _package)
 
     def __init__(self):
         super(PackageBuilder, self).__init__()
@@ -201,33 +256,6 @@ class PackageBuilder(tagvaluebuilders.PackageBuilder):
         else:
             raise CardinalityError('Package::CheckSum')
 
-    def set_pkg_source_info(self, doc, text):
-        """Sets the package's source information, if not already set.
-        text - Free form text.
-        Raises CardinalityError if already defined.
-        Raises OrderError if no package previously defined.
-        """
-        self.assert_package_exists()
-        if not self.package_source_info_set:
-            self.package_source_info_set = True
-            doc.package.source_info = text
-            return True
-        else:
-            raise CardinalityError('Package::SourceInfo')
-
-    def set_pkg_verif_code(self, doc, code):
-        """Sets the package verification code, if not already set.
-        code - A string.
-        Raises CardinalityError if already defined.
-        Raises OrderError if no package previously defined.
-        """
-        self.assert_package_exists()
-        if not self.package_verif_set:
-            self.package_verif_set = True
-            doc.package.verif_code = code
-        else:
-            raise CardinalityError('Package::VerificationCode')
-
     def set_pkg_excl_file(self, doc, filename):
         """Sets the package's verification code excluded file.
         Raises OrderError if no package previously defined.
@@ -235,180 +263,98 @@ class PackageBuilder(tagvaluebuilders.PackageBuilder):
         self.assert_package_exists()
         doc.package.add_exc_file(filename)
 
-    def set_pkg_license_comment(self, doc, text):
-        """Sets the package's license comment.
-        Raises OrderError if no package previously defined.
-        Raises CardinalityError if already set.
-        """
-        self.assert_package_exists()
-        if not self.package_license_comment_set:
-            self.package_license_comment_set = True
-            doc.package.license_comment = text
-            return True
-        else:
-            raise CardinalityError('Package::LicenseComment')
-
-    def set_pkg_cr_text(self, doc, text):
-        """Sets the package's license comment.
-        Raises OrderError if no package previously defined.
-        Raises CardinalityError if already set.
-        """
-        self.assert_package_exists()
-        if not self.package_cr_text_set:
-            self.package_cr_text_set = True
-            doc.package.cr_text = text
-        else:
-            raise CardinalityError('Package::CopyrightText')
-
-    def set_pkg_summary(self, doc, text):
-        """Set's the package summary.
-        Raises CardinalityError if summary already set.
-        Raises OrderError if no package previously defined.
-        """
-        self.assert_package_exists()
-        if not self.package_summary_set:
-            self.package_summary_set = True
-            doc.package.summary = text
-        else:
-            raise CardinalityError('Package::Summary')
-
-    def set_pkg_desc(self, doc, text):
-        """Set's the package's description.
-        Raises CardinalityError if description already set.
-        Raises OrderError if no package previously defined.
-        """
-        self.assert_package_exists()
-        if not self.package_desc_set:
-            self.package_desc_set = True
-            doc.package.description = text
-        else:
-            raise CardinalityError('Package::Description')
-
 
 class FileBuilder(tagvaluebuilders.FileBuilder):
+    __slots__ = ()
 
     def __init__(self):
         super(FileBuilder, self).__init__()
 
+    def current_file(self, doc, name):
+        """Returns the file being built.
+        Raises OrderError(name) if no package or file defined.
+        """
+        if self.has_package(doc) and self.has_file(doc):
+            return self.file(doc)
+        else:
+            raise OrderError(name)
+
     def set_file_chksum(self, doc, chk_sum):
         """Sets the file check sum, if not already set.
         chk_sum - A string
         Raises CardinalityError if already defined.
         Raises OrderError if no package previously defined.
         """
-        if self.has_package(doc) and self.has_file(doc):
-            if not self.file_chksum_set:
-                self.file_chksum_set = True
-                self.file(doc).chk_sum = checksum.Algorithm('SHA1', chk_sum)
-                return True
-            else:
-                raise CardinalityError('File::CheckSum')
-        else:
-            raise OrderError('File::CheckSum')
+        spdx_file = self.current_file(doc, 'File::CheckSum')
+        if self.file_chksum_set:
+            raise CardinalityError('File::CheckSum')
+        self.file_chksum_set = True
+        spdx_file.chk_sum = checksum.Algorithm('SHA1', chk_sum)
+        return True
 
     def set_file_license_comment(self, doc, text):
         """
         Raises OrderError if no package or file defined.
         Raises CardinalityError if more than one per file.
         """
-        if self.has_package(doc) and self.has_file(doc):
-            if not self.file_license_comment_set:
-                self.file_license_comment_set = True
-                self.file(doc).license_comment = text
-                return True
-            else:
-                raise CardinalityError('File::LicenseComment')
-        else:
-            raise OrderError('File::LicenseComment')
+        spdx_file = self.current_file(doc, 'File::LicenseComment')
+        if self.file_license_comment_set:
+            raise CardinalityError('File::LicenseComment')
+        self.file_license_comment_set = True
+        spdx_file.license_comment = text
+        return True
 
     def set_file_copyright(self, doc, text):
         """Raises OrderError if no package or file defined.
         Raises CardinalityError if more than one.
         """
-        if self.has_package(doc) and self.has_file(doc):
-            if not self.file_copytext_set:
-                self.file_copytext_set = True
-                self.file(doc).copyright = text
-                return True
-            else:
-                raise CardinalityError('File::CopyRight')
-        else:
-            raise OrderError('File::CopyRight')
+        spdx_file = self.current_file(doc, 'File::CopyRight')
+        if self.file_copytext_set:
+            raise CardinalityError('File::CopyRight')
+        self.file_copytext_set = True
+        spdx_file.copyright = text
+        return True
 
     def set_file_comment(self, doc, text):
         """Raises OrderError if no package or no file defined.
         Raises CardinalityError if more than one comment set.
         """
-        if self.has_package(doc) and self.has_file(doc):
-            if not self.file_comment_set:
-                self.file_comment_set = True
-                self.file(doc).comment = text
-                return True
-            else:
-                raise CardinalityError('File::Comment')
-        else:
-            raise OrderError('File::Comment')
+        spdx_file = self.current_file(doc, 'File::Comment')
+        if self.file_comment_set:
+            raise CardinalityError('File::Comment')
+        self.file_comment_set = True
+        spdx_file.comment = text
+        return True
 
     def set_file_notice(self, doc, text):
         """Raises OrderError if no package or file defined.
         Raises CardinalityError if more than one.
         """
-        if self.has_package(doc) and self.has_file(doc):
-            if not self.file_notice_set:
-                self.file_notice_set = True
-                self.file(doc).notice = tagvaluebuilders.str_from_text(text)
-                return True
-            else:
-                raise CardinalityError('File::Notice')
-        else:
-            raise OrderError('File::Notice')
+        spdx_file = self.current_file(doc, 'File::Notice')
+        if self.file_notice_set:
+            raise CardinalityError('File::Notice')
+        self.file_notice_set = True
+        spdx_file.notice = tagvaluebuilders.str_from_text(text)
+        return True
 
 
 class SnippetBuilder(tagvaluebuilders.SnippetBuilder):
+    __slots__ = ()
+    set_snippet_lic_comment = once_setter(
+        'snippet_lic_comment_set', 'license_comment',
+        'Snippet::licenseComments', _snippet)
+    set_snippet_comment = once_setter(
+        'snippet_comment_set', 'comment', 'Snippet::comment', _snippet)
+    set_snippet_copyright = once_setter(
+        'snippet_copyright_set', 'copyright', 'Snippet::copyrightText',
+        _snippet)
 
     def __init__(self):
         super(SnippetBuilder, self).__init__()
 
-    def set_snippet_lic_comment(self, doc, lic_comment):
-        """Sets the snippet's license comment.
-        Raises OrderError if no snippet previously defined.
-        Raises CardinalityError if already set.
-        """
-        self.assert_snippet_exists()
-        if not self.snippet_lic_comment_set:
-            self.snippet_lic_comment_set = True
-            doc.snippet[-1].license_comment = lic_comment
-        else:
-            CardinalityError('Snippet::licenseComments')
-
-    def set_snippet_comment(self, doc, comment):
-        """
-        Sets general comments about the snippet.
-        Raises OrderError if no snippet previously defined.
-        Raises CardinalityError if comment already set.
-        """
-        self.assert_snippet_exists()
-        if not self.snippet_comment_set:
-            self.snippet_comment_set = True
-            doc.snippet[-1].comment = comment
-            return True
-        else:
-            raise CardinalityError('Snippet::comment')
-
-    def set_snippet_copyright(self, doc, copyright):
-        """Sets the snippet's copyright text.
-        Raises OrderError if no snippet previously defined.
-        Raises CardinalityError if already set.
-        """
-        self.assert_snippet_exists()
-        if not self.snippet_copyright_set:
-            self.snippet_copyright_set = True
-            doc.snippet[-1].copyright = copyright
-        else:
-            raise CardinalityError('Snippet::copyrightText')
-
 
 class ReviewBuilder(tagvaluebuilders.ReviewBuilder):
+    __slots__ = ()
 
     def __init__(self):
         super(ReviewBuilder, self).__init__()
@@ -429,6 +375,12 @@ class ReviewBuilder(tagvaluebuilders.ReviewBuilder):
 
 
 class AnnotationBuilder(tagvaluebuilders.AnnotationBuilder):
+    __slots__ = ()
+    # Annotation type IRI fragments and the annotation types they denote.
+    ANNOTATION_TYPES = {
+        'annotationType_other': 'OTHER',
+        'annotationType_review': 'REVIEW',
+    }
 
     def __init__(self):
         super(AnnotationBuilder, self).__init__()
@@ -453,16 +405,13 @@ class AnnotationBuilder(tagvaluebuilders.AnnotationBuilder):
         """
         if len(doc.annotations) != 0:
             if not self.annotation_type_set:
-                if annotation_type.endswith('annotationType_other'):
-                    self.annotation_type_set = True
-                    doc.annotations[-1].annotation_type = 'OTHER'
-                    return True
-                elif annotation_type.endswith('annotationType_review'):
-                    self.annotation_type_set = True
-                    doc.annotations[-1].annotation_type = 'REVIEW'
-                    return True
-                else:
+                fragment = annotation_type.rsplit('#', 1)[-1].rsplit('/', 1)[-1]
+                value = self.ANNOTATION_TYPES.get(fragment)
+                if value is None:
                     raise SPDXValueError('Annotation::AnnotationType')
+                self.annotation_type_set = True
+                doc.annotations[-1].annotation_type = value
+                return True
             else:
                 raise CardinalityError('Annotation::AnnotationType')
         else:
@@ -472,10 +421,14 @@ class AnnotationBuilder(tagvaluebuilders.AnnotationBuilder):
 class Builder(DocBuilder, EntityBuilder, CreationInfoBuilder, PackageBuilder,
               FileBuilder, SnippetBuilder, ReviewBuilder, ExternalDocumentRefBuilder,
               AnnotationBuilder):
+    __slots__ = (DocBuilder.FLAGS + CreationInfoBuilder.FLAGS +
+                 ReviewBuilder.FLAGS + PackageBuilder.FLAGS +
+                 FileBuilder.FLAGS + SnippetBuilder.FLAGS +
+                 AnnotationBuilder.FLAGS)
 
     def __init__(self):
-        super(Builder, self).__init__()
-        # FIXME: this state does not make sense
+        # reset() initializes the state of every base builder, so their
+        # __init__ methods are not chained through the MRO.
         self.reset()
 
     def reset(self):
@@ -489,3 +442,4 @@ class Builder(DocBuilder, EntityBuilder, CreationInfoBuilder, PackageBuilder,
         self.reset_file_stat()
         self.reset_reviews()
         self.reset_annotations()
+        self.reset_snippet()
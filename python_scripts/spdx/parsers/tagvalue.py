@@ -14,10 +14,11 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import os
 import re
+from sys import intern
 
 from ply import yacc
-import six
 
 from spdx import config
 from spdx import utils
@@ -25,9 +26,20 @@ from spdx.parsers.builderexceptions import CardinalityError
 from spdx.parsers.builderexceptions import OrderError
 from spdx.parsers.builderexceptions import SPDXValueError
 from spdx.parsers.lexers.tagvalue import Lexer
+from spdx.parsers.loggers import BufferedLogger
 from spdx import document
 
 
+# Where Parser.build caches the generated LALR tables.
+PARSER_TABLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'parsetab.pickle')
+
+# The value markers carry no state, so every NOASSERTION, NONE and UNKNOWN
+# in a document shares one instance instead of allocating per tag.
+_NO_ASSERT = utils.NoAssert()
+_SPDX_NONE = utils.SPDXNone()
+_UNKNOWN = utils.UnKnown()
+
 ERROR_MESSAGES = {
     'TOOL_VALUE': 'Invalid tool value {0} at line: {1}',
     'ORG_VALUE': 'Invalid organization value {0} at line: {1}',
@@ -114,209 +126,406 @@ ERROR_MESSAGES = {
     'SNIP_LICS_INFO_VALUE': 'LicenseInfoInSnippet must be NOASSERTION, NONE or license identifier, line: {0}',
 }
 
+# Bound str.format of every message, so reporting is a single call.
+ERROR_FORMATTERS = dict((key, msg.format) for key, msg in ERROR_MESSAGES.items())
+
+
+# Attribute symbols by SPDX section, in the order the sections appear in a
+# document. Parser.p_start accepts them in any order; the builders report
+# attributes that turn up outside their section.
+ATTRIBUTE_SECTIONS = (
+    # Document and creation info
+    ('spdx_version', 'spdx_id', 'data_lics', 'doc_name', 'ext_doc_ref',
+     'doc_comment', 'doc_namespace', 'creator', 'created', 'creator_comment',
+     'locs_list_ver'),
+    # Review
+    ('reviewer', 'review_date', 'review_comment'),
+    # Annotation
+    ('annotator', 'annotation_date', 'annotation_comment', 'annotation_type',
+     'annotation_spdx_id'),
+    # Package
+    ('package_name', 'package_version', 'pkg_down_location', 'pkg_home',
+     'pkg_summary', 'pkg_src_info', 'pkg_file_name', 'pkg_supplier',
+     'pkg_orig', 'pkg_chksum', 'pkg_verif', 'pkg_desc', 'pkg_lic_decl',
+     'pkg_lic_conc', 'pkg_lic_ff', 'pkg_lic_comment', 'pkg_cr_text'),
+    # Files
+    ('file_name', 'file_type', 'file_chksum', 'file_conc', 'file_lics_info',
+     'file_cr_text', 'file_lics_comment', 'file_notice', 'file_comment',
+     'file_contrib', 'file_dep', 'file_artifact'),
+    # Snippets
+    ('snip_spdx_id', 'snip_name', 'snip_comment', 'snip_cr_text',
+     'snip_lic_comment', 'snip_file_spdx_id', 'snip_lics_conc',
+     'snip_lics_info'),
+    # Extracted licenses
+    ('extr_lic_id', 'extr_lic_text', 'extr_lic_name', 'lic_xref',
+     'lic_comment'),
+    # Anything else is reported and skipped
+    ('unknown_tag',),
+)
+
+
+# Builder method creating the entity for each entity value token.
+ENTITY_BUILDERS = (
+    ('TOOL_VALUE', 'build_tool'),
+    ('ORG_VALUE', 'build_org'),
+    ('PERSON_VALUE', 'build_person'),
+)
+
+
+# Value symbols that are a choice between single tokens, with what each token
+# stands for: a constant, the name of the Parser method that builds the value
+# from the token's text, or None to pass the text through. The setter
+# productions take these tokens directly instead of reducing a separate value
+# symbol for every tag.
+VALUE_TOKENS = {
+    'conc_license': (('NO_ASSERT', _NO_ASSERT), ('NONE', _SPDX_NONE),
+                     ('LINE', 'license_from_value')),
+    'extr_lic_name_value': (('LINE', None), ('NO_ASSERT', _NO_ASSERT)),
+    'file_cr_value': (('TEXT', None), ('NONE', _SPDX_NONE),
+                      ('NO_ASSERT', _NO_ASSERT)),
+    'file_lic_info_value': (('NONE', _SPDX_NONE), ('NO_ASSERT', _NO_ASSERT),
+                            ('LINE', 'license_from_identifier')),
+    'file_type_value': (('OTHER', None), ('SOURCE', None), ('ARCHIVE', None),
+                        ('BINARY', None)),
+    'pkg_cr_text_value': (('TEXT', None), ('NONE', _SPDX_NONE),
+                          ('NO_ASSERT', _NO_ASSERT)),
+    'pkg_down_value': (('LINE', None), ('NONE', _SPDX_NONE),
+                       ('NO_ASSERT', _NO_ASSERT)),
+    'pkg_home_value': (('LINE', None), ('NONE', _SPDX_NONE),
+                       ('NO_ASSERT', _NO_ASSERT)),
+    'pkg_lic_ff_value': (('NONE', _SPDX_NONE), ('NO_ASSERT', _NO_ASSERT),
+                         ('LINE', 'license_from_identifier')),
+    'snip_cr_value': (('TEXT', None), ('NONE', _SPDX_NONE),
+                      ('NO_ASSERT', _NO_ASSERT)),
+    'snip_lic_info_value': (('NONE', _SPDX_NONE), ('NO_ASSERT', _NO_ASSERT),
+                            ('LINE', 'license_from_identifier')),
+}
+
+
+# Attributes whose value goes straight to one builder setter. Each row is
+# (symbol, tag token, value symbol, builder setter, tag name, tag that must
+# come first, error message key, builder errors reported rather than raised).
+# _setter_rules turns every row into its value and error productions.
+SETTER_RULES = (
+    # Document and creation info
+    ('doc_name', 'DOC_NAME', 'LINE', 'set_doc_name',
+     'DocumentName', None, 'DOC_NAME_VALUE', (CardinalityError,)),
+    ('doc_comment', 'DOC_COMMENT', 'TEXT', 'set_doc_comment',
+     'DocumentComment', None, 'DOC_COMMENT_VALUE_TYPE', (CardinalityError,)),
+    ('created', 'CREATED', 'DATE', 'set_created_date',
+     'Created', None, 'CREATED_VALUE_TYPE', (CardinalityError,)),
+    ('creator_comment', 'CREATOR_COMMENT', 'TEXT', 'set_creation_comment',
+     'CreatorComment', None, 'CREATOR_COMMENT_VALUE_TYPE', (CardinalityError,)),
+    # Review info
+    ('review_date', 'REVIEW_DATE', 'DATE', 'add_review_date',
+     'ReviewDate', 'Reviewer', 'REVIEW_DATE_VALUE_TYPE',
+     (OrderError, CardinalityError)),
+    ('review_comment', 'REVIEW_COMMENT', 'TEXT', 'add_review_comment',
+     'ReviewComment', 'Reviewer', 'REVIEW_COMMENT_VALUE_TYPE',
+     (OrderError, CardinalityError)),
+    # Annotation info
+    ('annotation_date', 'ANNOTATION_DATE', 'DATE', 'add_annotation_date',
+     'AnnotationDate', 'Annotator', 'ANNOTATION_DATE_VALUE_TYPE',
+     (OrderError, CardinalityError)),
+    ('annotation_comment', 'ANNOTATION_COMMENT', 'TEXT', 'add_annotation_comment',
+     'AnnotationComment', 'Annotator', 'ANNOTATION_COMMENT_VALUE_TYPE',
+     (OrderError, CardinalityError)),
+    ('annotation_type', 'ANNOTATION_TYPE', 'LINE', 'add_annotation_type',
+     'AnnotationType', 'Annotator', 'ANNOTATION_TYPE_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('annotation_spdx_id', 'ANNOTATION_SPDX_ID', 'LINE', 'set_annotation_spdx_id',
+     'SPDXREF', 'Annotator', 'ANNOTATION_SPDX_ID_VALUE',
+     (OrderError, CardinalityError)),
+    # Package fields
+    ('package_name', 'PKG_NAME', 'LINE', 'create_package',
+     'PackageName', None, 'PACKAGE_NAME_VALUE', (CardinalityError,)),
+    ('package_version', 'PKG_VERSION', 'LINE', 'set_pkg_vers',
+     'PackageVersion', 'PackageName', 'PKG_VERSION_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_down_location', 'PKG_DOWN', 'pkg_down_value', 'set_pkg_down_location',
+     'PackageDownloadLocation', 'PackageName', 'PKG_DOWN_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_home', 'PKG_HOME', 'pkg_home_value', 'set_pkg_home',
+     'PackageHomePage', 'PackageName', 'PKG_HOME_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_summary', 'PKG_SUM', 'TEXT', 'set_pkg_summary',
+     'PackageSummary', 'PackageFileName', 'PKG_SUM_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_src_info', 'PKG_SRC_INFO', 'TEXT', 'set_pkg_source_info',
+     'PackageSourceInfo', 'PackageFileName', 'PKG_SRC_INFO_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_file_name', 'PKG_FILE_NAME', 'LINE', 'set_pkg_file_name',
+     'PackageFileName', 'PackageName', 'PKG_FILE_NAME_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_supplier', 'PKG_SUPPL', 'pkg_supplier_values', 'set_pkg_supplier',
+     'PackageSupplier', 'PackageName', 'PKG_SUPPL_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_orig', 'PKG_ORIG', 'pkg_supplier_values', 'set_pkg_originator',
+     'PackageOriginator', 'PackageName', 'PKG_ORIG_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_chksum', 'PKG_CHKSUM', 'CHKSUM', 'set_pkg_chk_sum',
+     'PackageChecksum', 'PackageFileName', 'PKG_CHKSUM_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_verif', 'PKG_VERF_CODE', 'LINE', 'set_pkg_verif_code',
+     'PackageVerificationCode', 'PackageName', 'PKG_VERF_CODE_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_desc', 'PKG_DESC', 'TEXT', 'set_pkg_desc',
+     'PackageDescription', 'PackageFileName', 'PKG_DESC_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_lic_decl', 'PKG_LICS_DECL', 'conc_license', 'set_pkg_license_declared',
+     'PackageLicenseDeclared', 'PackageName', 'PKG_LICS_DECL_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_lic_conc', 'PKG_LICS_CONC', 'conc_license', 'set_pkg_licenses_concluded',
+     'PackageLicenseConcluded', 'PackageFileName', 'PKG_LICS_CONC_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('pkg_lic_ff', 'PKG_LICS_FFILE', 'pkg_lic_ff_value', 'set_pkg_license_from_file',
+     'PackageLicenseInfoFromFiles', 'PackageName', 'PKG_LIC_FFILE_VALUE',
+     (OrderError, SPDXValueError)),
+    ('pkg_lic_comment', 'PKG_LICS_COMMENT', 'TEXT', 'set_pkg_license_comment',
+     'PackageLicenseComments', 'PackageFileName', 'PKG_LICS_COMMENT_VALUE',
+     (OrderError, CardinalityError)),
+    ('pkg_cr_text', 'PKG_CPY_TEXT', 'pkg_cr_text_value', 'set_pkg_cr_text',
+     'PackageCopyrightText', 'PackageFileName', 'PKG_CPY_TEXT_VALUE',
+     (OrderError, CardinalityError)),
+    # Files
+    ('file_name', 'FILE_NAME', 'LINE', 'set_file_name',
+     'FileName', 'PackageName', 'FILE_NAME_VALUE', (OrderError,)),
+    ('file_type', 'FILE_TYPE', 'file_type_value', 'set_file_type',
+     'FileType', 'FileName', 'FILE_TYPE_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_chksum', 'FILE_CHKSUM', 'CHKSUM', 'set_file_chksum',
+     'FileChecksum', 'FileName', 'FILE_CHKSUM_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_conc', 'FILE_LICS_CONC', 'conc_license', 'set_concluded_license',
+     'LicenseConcluded', 'FileName', 'FILE_LICS_CONC_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('file_lics_info', 'FILE_LICS_INFO', 'file_lic_info_value', 'set_file_license_in_file',
+     'LicenseInfoInFile', 'FileName', 'FILE_LICS_INFO_VALUE',
+     (OrderError, SPDXValueError)),
+    ('file_cr_text', 'FILE_CR_TEXT', 'file_cr_value', 'set_file_copyright',
+     'FileCopyrightText', 'FileName', 'FILE_CR_TEXT_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_lics_comment', 'FILE_LICS_COMMENT', 'TEXT', 'set_file_license_comment',
+     'LicenseComments', 'FileName', 'FILE_LICS_COMMENT_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_comment', 'FILE_COMMENT', 'TEXT', 'set_file_comment',
+     'FileComment', 'FileName', 'FILE_COMMENT_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_notice', 'FILE_NOTICE', 'TEXT', 'set_file_notice',
+     'FileNotice', 'FileName', 'FILE_NOTICE_VALUE',
+     (OrderError, CardinalityError)),
+    ('file_contrib', 'FILE_CONTRIB', 'LINE', 'add_file_contribution',
+     'FileContributor', 'FileName', 'FILE_CONTRIB_VALUE', (OrderError,)),
+    ('file_dep', 'FILE_DEP', 'LINE', 'add_file_dep',
+     'FileDependency', 'FileName', 'FILE_DEP_VALUE', (OrderError,)),
+    # Extracted licenses
+    ('extr_lic_id', 'LICS_ID', 'LINE', 'set_lic_id',
+     'LicenseID', None, 'LICS_ID_VALUE', (SPDXValueError,)),
+    ('extr_lic_text', 'LICS_TEXT', 'TEXT', 'set_lic_text',
+     'ExtractedText', 'LicenseID', 'LICS_TEXT_VALUE',
+     (OrderError, CardinalityError)),
+    ('extr_lic_name', 'LICS_NAME', 'extr_lic_name_value', 'set_lic_name',
+     'LicenseName', 'LicenseID', 'LICS_NAME_VALE',
+     (OrderError, CardinalityError)),
+    ('lic_xref', 'LICS_CRS_REF', 'LINE', 'add_lic_xref',
+     'LicenseCrossReference', 'LicenseName', 'LICS_CRS_REF_VALUE', (OrderError,)),
+    ('lic_comment', 'LICS_COMMENT', 'TEXT', 'set_lic_comment',
+     'LicenseComment', 'LicenseID', 'LICS_COMMENT_VALUE',
+     (OrderError, CardinalityError)),
+    # Snippets
+    ('snip_spdx_id', 'SNIPPET_SPDX_ID', 'LINE', 'create_snippet',
+     'SnippetSPDXID', None, 'SNIP_SPDX_ID_VALUE', (SPDXValueError,)),
+    ('snip_name', 'SNIPPET_NAME', 'LINE', 'set_snippet_name',
+     'SnippetName', 'SnippetSPDXID', 'SNIPPET_NAME_VALUE',
+     (OrderError, CardinalityError)),
+    ('snip_comment', 'SNIPPET_COMMENT', 'TEXT', 'set_snippet_comment',
+     'SnippetComment', 'SnippetSPDXID', 'SNIP_COMMENT_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('snip_cr_text', 'SNIPPET_CR_TEXT', 'snip_cr_value', 'set_snippet_copyright',
+     'SnippetCopyrightText', 'SnippetSPDXID', 'SNIP_COPYRIGHT_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('snip_lic_comment', 'SNIPPET_LICS_COMMENT', 'TEXT', 'set_snippet_lic_comment',
+     'SnippetLicenseComments', 'SnippetSPDXID', 'SNIP_LICS_COMMENT_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('snip_file_spdx_id', 'SNIPPET_FILE_SPDXID', 'LINE', 'set_snip_from_file_spdxid',
+     'SnippetFromFileSPDXID', 'SnippetSPDXID', 'SNIP_FILE_SPDXID_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('snip_lics_conc', 'SNIPPET_LICS_CONC', 'conc_license', 'set_snip_concluded_license',
+     'SnippetLicenseConcluded', 'SnippetSPDXID', 'SNIP_LICS_CONC_VALUE',
+     (OrderError, CardinalityError, SPDXValueError)),
+    ('snip_lics_info', 'SNIPPET_LICS_INFO', 'snip_lic_info_value', 'set_snippet_lics_info',
+     'LicenseInfoInSnippet', 'SnippetSPDXID', 'SNIP_LICS_INFO_VALUE',
+     (OrderError, SPDXValueError)),
+)
+
+
+# Values drawn from a small vocabulary that repeats across a document: the
+# annotation types and the SPDX ids that annotations and snippets point back
+# to. Interning them lets every occurrence share one string.
+INTERNED_VALUES = frozenset([
+    'annotation_type', 'annotation_spdx_id', 'snip_file_spdx_id',
+])
+
+
+# Approximate number of characters Parser.parse_file lexes at a time.
+STREAM_CHUNK_SIZE = 2 ** 20
+
+
+def _stream_chunks(infile, size=STREAM_CHUNK_SIZE):
+    """Yields the text of infile in runs of whole lines, each about size
+    characters long. A run is only cut where no token can continue: outside
+    any <text> block, after a line with more on it than a tag and its colon
+    (the value may start on the next line) or than whitespace (which lexes
+    together with the blank lines after it).
+    """
+    while True:
+        lines = infile.readlines(size)
+        if not lines:
+            return
+        text = ''.join(lines)
+        in_text = text.rfind('<text>') > text.rfind('</text>')
+        last = lines[-1].strip()
+        more = []
+        while in_text or not last or last.endswith(':'):
+            line = infile.readline()
+            if not line:
+                break
+            more.append(line)
+            if '<text>' in line or '</text>' in line:
+                in_text = line.rfind('<text>') > line.rfind('</text>')
+            last = line.strip()
+        if more:
+            text += ''.join(more)
+        yield text
+
+
+def _setter_rules(symbol, token, value_symbol, setter, tag, preceding_tag,
+                  error_key, errors):
+    """Returns the value and error productions for a SETTER_RULES row."""
+    # Builder errors stay exceptions: the builders are shared with the RDF
+    # parser and only raise on malformed input, so the well-formed path
+    # pays nothing for the try block.
+    interned = symbol in INTERNED_VALUES
+    alternatives = VALUE_TOKENS.get(value_symbol, ((value_symbol, None),))
+    constants = {}
+    builders = {}
+    for value_token, meaning in alternatives:
+        if isinstance(meaning, (utils.NoAssert, utils.SPDXNone)):
+            constants[value_token] = meaning
+        elif meaning is not None:
+            builders[value_token] = getattr(Parser, meaning)
+    converted = bool(constants or builders)
+
+    def p_value(self, p):
+        value = p[2]
+        if converted:
+            value_token = p.slice[2].type
+            if value_token in constants:
+                value = constants[value_token]
+            elif value_token in builders:
+                value = builders[value_token](self, value)
+        if interned:
+            value = intern(value)
+        try:
+            self.builder_setters[setter](self.document, value)
+        except errors as err:
+            line = p.lineno(1)
+            if isinstance(err, OrderError):
+                self.order_error(tag, preceding_tag, line)
+            elif isinstance(err, CardinalityError):
+                self.more_than_one_error(tag, line)
+            else:
+                self.value_error(error_key, line)
+
+    def p_value_error(self, p):
+        self.value_error(error_key, p.lineno(1))
+
+    p_value.__doc__ = '\n'.join(
+        ['{0} : {1} {2}'.format(symbol, token, alternatives[0][0])] +
+        ['| {0} {1}'.format(token, value_token)
+         for value_token, _ in alternatives[1:]])
+    p_value_error.__doc__ = '{0} : {1} error'.format(symbol, token)
+    return p_value, p_value_error
+
 
 class Parser(object):
+    # Generated productions share one line number, so name the start symbol.
+    start = 'start'
 
     def __init__(self, builder, logger):
         self.tokens = Lexer.tokens
         self.builder = builder
-        self.logger = logger
+        # Bound once here instead of looked up by name on every tag line.
+        self.builder_setters = dict(
+            (row[3], getattr(builder, row[3])) for row in SETTER_RULES)
+        self.entity_builders = dict(
+            (token, getattr(builder, name)) for token, name in ENTITY_BUILDERS)
+        # Malformed documents can report a message per line, so hand them
+        # to logger in batches; parse() flushes whatever is left.
+        self.logger = BufferedLogger(logger)
         self.error = False
-        self.license_list_parser = utils.LicenseListParser()
-        self.license_list_parser.build(write_tables=0, debug=0)
-
-    def p_start_1(self, p):
-        'start : start attrib '
-        pass
+        self.license_cache = {}
+        self.license_expr_cache = {}
 
-    def p_start_2(self, p):
-        'start : attrib '
+    # Attributes reduce straight into start rather than through an
+    # intermediate attrib symbol, saving one reduction per tag line. The
+    # empty base keeps this to one alternative per attribute.
+    def p_start(self, p):
         pass
 
-    def p_attrib(self, p):
-        """attrib : spdx_version
-                  | spdx_id
-                  | data_lics
-                  | doc_name
-                  | ext_doc_ref
-                  | doc_comment
-                  | doc_namespace
-                  | creator
-                  | created
-                  | creator_comment
-                  | locs_list_ver
-                  | reviewer
-                  | review_date
-                  | review_comment
-                  | annotator
-                  | annotation_date
-                  | annotation_comment
-                  | annotation_type
-                  | annotation_spdx_id
-                  | package_name
-                  | package_version
-                  | pkg_down_location
-                  | pkg_home
-                  | pkg_summary
-                  | pkg_src_info
-                  | pkg_file_name
-                  | pkg_supplier
-                  | pkg_orig
-                  | pkg_chksum
-                  | pkg_verif
-                  | pkg_desc
-                  | pkg_lic_decl
-                  | pkg_lic_conc
-                  | pkg_lic_ff
-                  | pkg_lic_comment
-                  | pkg_cr_text
-                  | file_name
-                  | file_type
-                  | file_chksum
-                  | file_conc
-                  | file_lics_info
-                  | file_cr_text
-                  | file_lics_comment
-                  | file_notice
-                  | file_comment
-                  | file_contrib
-                  | file_dep
-                  | file_artifact
-                  | snip_spdx_id
-                  | snip_name
-                  | snip_comment
-                  | snip_cr_text
-                  | snip_lic_comment
-                  | snip_file_spdx_id
-                  | snip_lics_conc
-                  | snip_lics_info
-                  | extr_lic_id
-                  | extr_lic_text
-                  | extr_lic_name
-                  | lic_xref
-                  | lic_comment
-                  | unknown_tag
-        """
-        pass
+    p_start.__doc__ = 'start :\n' + ''.join(
+        '| start {0}\n'.format(symbol)
+        for section in ATTRIBUTE_SECTIONS for symbol in section)
 
     def more_than_one_error(self, tag, line):
-        self.error = True
-        msg = ERROR_MESSAGES['MORE_THAN_ONE'].format(tag, line)
-        self.logger.log(msg)
+        self.value_error('MORE_THAN_ONE', tag, line)
 
     def order_error(self, first_tag, second_tag, line):
         """Reports an OrderError. Error message will state that
         first_tag came before second_tag.
         """
-        self.error = True
-        msg = ERROR_MESSAGES['A_BEFORE_B'].format(first_tag, second_tag, line)
-        self.logger.log(msg)
-
-    def p_lic_xref_1(self, p):
-        """lic_xref : LICS_CRS_REF LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_lic_xref(self.document, value)
-        except OrderError:
-            self.order_error('LicenseCrossReference', 'LicenseName', p.lineno(1))
-
-    def p_lic_xref_2(self, p):
-        """lic_xref : LICS_CRS_REF error"""
-        self.error = True
-        msg = ERROR_MESSAGES['LICS_CRS_REF_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_lic_comment_1(self, p):
-        """lic_comment : LICS_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_lic_comment(self.document, value)
-        except OrderError:
-            self.order_error('LicenseComment', 'LicenseID', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('LicenseComment', p.lineno(1))
-
-    def p_lic_comment_2(self, p):
-        """lic_comment : LICS_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['LICS_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_extr_lic_name_1(self, p):
-        """extr_lic_name : LICS_NAME extr_lic_name_value"""
-        try:
-            self.builder.set_lic_name(self.document, p[2])
-        except OrderError:
-            self.order_error('LicenseName', 'LicenseID', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('LicenseName', p.lineno(1))
-
-    def p_extr_lic_name_2(self, p):
-        """extr_lic_name : LICS_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['LICS_NAME_VALE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_extr_lic_name_value_1(self, p):
-        """extr_lic_name_value : LINE"""
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_extr_lic_name_value_2(self, p):
-        """extr_lic_name_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_extr_lic_text_1(self, p):
-        """extr_lic_text : LICS_TEXT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_lic_text(self.document, value)
-        except OrderError:
-            self.order_error('ExtractedText', 'LicenseID', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('ExtractedText', p.lineno(1))
+        self.value_error('A_BEFORE_B', first_tag, second_tag, line)
 
-    def p_extr_lic_text_2(self, p):
-        """extr_lic_text : LICS_TEXT error"""
+    def value_error(self, key, *args):
+        """Reports the ERROR_MESSAGES entry key formatted with args."""
         self.error = True
-        msg = ERROR_MESSAGES['LICS_TEXT_VALUE'].format(p.lineno(1))
+        msg = ERROR_FORMATTERS[key](*args)
         self.logger.log(msg)
 
-    def p_extr_lic_id_1(self, p):
-        """extr_lic_id : LICS_ID LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_lic_id(self.document, value)
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['LICS_ID_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_extr_lic_id_2(self, p):
-        """extr_lic_id : LICS_ID error"""
-        self.error = True
-        msg = ERROR_MESSAGES['LICS_ID_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+    def license_from_identifier(self, identifier):
+        """Returns the License for identifier, reusing the instance already
+        built for it while parsing the current document.
+        """
+        lic = self.license_cache.get(identifier)
+        if lic is None:
+            lic = document.License.from_identifier(identifier)
+            self.license_cache[identifier] = lic
+        return lic
+
+    def license_from_expression(self, expression):
+        """Returns the license tree for a license expression, parsing each
+        distinct expression only once per document.
+        """
+        lic = self.license_expr_cache.get(expression)
+        if lic is None:
+            lic = utils.parse_license_list(expression)
+            self.license_expr_cache[expression] = lic
+        return lic
+
+    def license_from_value(self, value):
+        """Returns the License for a concluded or declared license value,
+        which is either a single identifier or a license expression.
+        """
+        # LINE values are single-line, so a LicenseRef- prefix with anything
+        # after it is what the LicenseRef-.+ pattern used to match.
+        if value in config.LICENSE_MAP or (
+                value.startswith('LicenseRef-') and len(value) > 11):
+            return self.license_from_identifier(value)
+        return self.license_from_expression(value)
 
     def p_uknown_tag(self, p):
         """unknown_tag : UNKNOWN_TAG LINE"""
-        self.error = True
-        msg = ERROR_MESSAGES['UNKNOWN_TAG'].format(p[1], p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('UNKNOWN_TAG', p[1], p.lineno(1))
 
     def p_file_artifact_1(self, p):
         """file_artifact : prj_name_art file_art_rest
@@ -326,9 +535,7 @@ class Parser(object):
 
     def p_file_artificat_2(self, p):
         """file_artifact : prj_name_art error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_ART_OPT_ORDER'].format(p.lineno(2))
-        self.logger.log(msg)
+        self.value_error('FILE_ART_OPT_ORDER', p.lineno(2))
 
     def p_file_art_rest(self, p):
         """file_art_rest : prj_home_art prj_uri_art
@@ -342,26 +549,21 @@ class Parser(object):
         """prj_uri_art : ART_PRJ_URI UN_KNOWN"""
         try:
             self.builder.set_file_atrificat_of_project(self.document,
-                'uri', utils.UnKnown())
+                'uri', _UNKNOWN)
         except OrderError:
             self.order_error('ArtificatOfProjectURI', 'FileName', p.lineno(1))
 
     def p_prj_uri_art_2(self, p):
         """prj_uri_art : ART_PRJ_URI LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_file_atrificat_of_project(self.document, 'uri', value)
         except OrderError:
             self.order_error('ArtificatOfProjectURI', 'FileName', p.lineno(1))
 
     def p_prj_uri_art_3(self, p):
         """prj_uri_art : ART_PRJ_URI error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ART_PRJ_URI_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('ART_PRJ_URI_VALUE', p.lineno(1))
 
     def p_prj_home_art_1(self, p):
         """prj_home_art : ART_PRJ_HOME LINE"""
@@ -374,922 +576,49 @@ class Parser(object):
         """prj_home_art : ART_PRJ_HOME UN_KNOWN"""
         try:
             self.builder.set_file_atrificat_of_project(self.document,
-                'home', utils.UnKnown())
+                'home', _UNKNOWN)
         except OrderError:
             self.order_error('ArtifactOfProjectName', 'FileName', p.lineno(1))
 
     def p_prj_home_art_3(self, p):
         """prj_home_art : ART_PRJ_HOME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ART_PRJ_HOME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('ART_PRJ_HOME_VALUE', p.lineno(1))
 
     def p_prj_name_art_1(self, p):
         """prj_name_art : ART_PRJ_NAME LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_file_atrificat_of_project(self.document, 'name', value)
         except OrderError:
             self.order_error('ArtifactOfProjectName', 'FileName', p.lineno(1))
 
     def p_prj_name_art_2(self, p):
         """prj_name_art : ART_PRJ_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ART_PRJ_NAME_VALUE'].format(p.lineno())
-        self.logger.log(msg)
-
-    def p_file_dep_1(self, p):
-        """file_dep : FILE_DEP LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_file_dep(self.document, value)
-        except OrderError:
-            self.order_error('FileDependency', 'FileName', p.lineno(1))
-
-    def p_file_dep_2(self, p):
-        """file_dep : FILE_DEP error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_DEP_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_contrib_1(self, p):
-        """file_contrib : FILE_CONTRIB LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_file_contribution(self.document, value)
-        except OrderError:
-            self.order_error('FileContributor', 'FileName', p.lineno(1))
-
-    def p_file_contrib_2(self, p):
-        """file_contrib : FILE_CONTRIB error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_CONTRIB_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_notice_1(self, p):
-        """file_notice : FILE_NOTICE TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_file_notice(self.document, value)
-        except OrderError:
-            self.order_error('FileNotice', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('FileNotice', p.lineno(1))
-
-    def p_file_notice_2(self, p):
-        """file_notice : FILE_NOTICE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_NOTICE_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_cr_text_1(self, p):
-        """file_cr_text : FILE_CR_TEXT file_cr_value"""
-        try:
-            self.builder.set_file_copyright(self.document, p[2])
-        except OrderError:
-            self.order_error('FileCopyrightText', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('FileCopyrightText', p.lineno(1))
-
-    def p_file_cr_text_2(self, p):
-        """file_cr_text : FILE_CR_TEXT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_CR_TEXT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_cr_value_1(self, p):
-        """file_cr_value : TEXT"""
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_file_cr_value_2(self, p):
-        """file_cr_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_file_cr_value_3(self, p):
-        """file_cr_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_file_lics_comment_1(self, p):
-        """file_lics_comment : FILE_LICS_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_file_license_comment(self.document, value)
-        except OrderError:
-            self.order_error('LicenseComments', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('LicenseComments', p.lineno(1))
-
-    def p_file_lics_comment_2(self, p):
-        """file_lics_comment : FILE_LICS_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_LICS_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_lics_info_1(self, p):
-        """file_lics_info : FILE_LICS_INFO file_lic_info_value"""
-        try:
-            self.builder.set_file_license_in_file(self.document, p[2])
-        except OrderError:
-            self.order_error('LicenseInfoInFile', 'FileName', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['FILE_LICS_INFO_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_file_lics_info_2(self, p):
-        """file_lics_info : FILE_LICS_INFO error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_LICS_INFO_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_lic_info_value_1(self, p):
-        """file_lic_info_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_file_lic_info_value_2(self, p):
-        """file_lic_info_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    # License Identifier
-    def p_file_lic_info_value_3(self, p):
-        """file_lic_info_value : LINE"""
-        if six.PY2:
-            value = p[1].decode(encoding='utf-8')
-        else:
-            value = p[1]
-        p[0] = document.License.from_identifier(value)
-
-    def p_conc_license_1(self, p):
-        """conc_license : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_conc_license_2(self, p):
-        """conc_license : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_conc_license_3(self, p):
-        """conc_license : LINE"""
-        if six.PY2:
-            value = p[1].decode(encoding='utf-8')
-        else:
-            value = p[1]
-        ref_re = re.compile('LicenseRef-.+', re.UNICODE)
-        if (p[1] in config.LICENSE_MAP.keys()) or (ref_re.match(p[1]) is not None):
-            p[0] = document.License.from_identifier(value)
-        else:
-            p[0] = self.license_list_parser.parse(value)
-
-    def p_file_name_1(self, p):
-        """file_name : FILE_NAME LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_file_name(self.document, value)
-        except OrderError:
-            self.order_error('FileName', 'PackageName', p.lineno(1))
-
-    def p_file_name_2(self, p):
-        """file_name : FILE_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_NAME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('ART_PRJ_NAME_VALUE', p.lineno(1))
 
     def p_spdx_id(self, p):
         """spdx_id : SPDX_ID LINE"""
-        if six.PY2:
-            value = p[2].decode(encoding='utf-8')
-        else:
-            value = p[2]
+        value = p[2]
         if not self.builder.doc_spdx_id_set:
             self.builder.set_doc_spdx_id(self.document, value)
         else:
             self.builder.set_file_spdx_id(self.document, value)
 
-    def p_file_comment_1(self, p):
-        """file_comment : FILE_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_file_comment(self.document, value)
-        except OrderError:
-            self.order_error('FileComment', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('FileComment', p.lineno(1))
-
-    def p_file_comment_2(self, p):
-        """file_comment : FILE_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_type_1(self, p):
-        """file_type : FILE_TYPE file_type_value"""
-        try:
-            self.builder.set_file_type(self.document, p[2])
-        except OrderError:
-            self.order_error('FileType', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('FileType', p.lineno(1))
-
-    def p_file_type_2(self, p):
-        """file_type : FILE_TYPE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_TYPE_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_chksum_1(self, p):
-        """file_chksum : FILE_CHKSUM CHKSUM"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_file_chksum(self.document, value)
-        except OrderError:
-            self.order_error('FileChecksum', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('FileChecksum', p.lineno(1))
-
-    def p_file_chksum_2(self, p):
-        """file_chksum : FILE_CHKSUM error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_CHKSUM_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_conc_1(self, p):
-        """file_conc : FILE_LICS_CONC conc_license"""
-        try:
-            self.builder.set_concluded_license(self.document, p[2])
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['FILE_LICS_CONC_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-        except OrderError:
-            self.order_error('LicenseConcluded', 'FileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('LicenseConcluded', p.lineno(1))
-
-    def p_file_conc_2(self, p):
-        """file_conc : FILE_LICS_CONC error"""
-        self.error = True
-        msg = ERROR_MESSAGES['FILE_LICS_CONC_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_file_type_value(self, p):
-        """file_type_value : OTHER
-                           | SOURCE
-                           | ARCHIVE
-                           | BINARY
-        """
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_pkg_desc_1(self, p):
-        """pkg_desc : PKG_DESC TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_desc(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('PackageDescription', p.lineno(1))
-        except OrderError:
-            self.order_error('PackageDescription', 'PackageFileName', p.lineno(1))
-
-    def p_pkg_desc_2(self, p):
-        """pkg_desc : PKG_DESC error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_DESC_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_summary_1(self, p):
-        """pkg_summary : PKG_SUM TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_summary(self.document, value)
-        except OrderError:
-            self.order_error('PackageSummary', 'PackageFileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageSummary', p.lineno(1))
-
-    def p_pkg_summary_2(self, p):
-        """pkg_summary : PKG_SUM error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_SUM_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_cr_text_1(self, p):
-        """pkg_cr_text : PKG_CPY_TEXT pkg_cr_text_value"""
-        try:
-            self.builder.set_pkg_cr_text(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageCopyrightText', 'PackageFileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageCopyrightText', p.lineno(1))
-
-    def p_pkg_cr_text_2(self, p):
-        """pkg_cr_text : PKG_CPY_TEXT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_CPY_TEXT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_cr_text_value_1(self, p):
-        """pkg_cr_text_value : TEXT"""
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_pkg_cr_text_value_2(self, p):
-        """pkg_cr_text_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_pkg_cr_text_value_3(self, p):
-        """pkg_cr_text_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_pkg_lic_comment_1(self, p):
-        """pkg_lic_comment : PKG_LICS_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_license_comment(self.document, value)
-        except OrderError:
-            self.order_error('PackageLicenseComments', 'PackageFileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageLicenseComments', p.lineno(1))
-
-    def p_pkg_lic_comment_2(self, p):
-        """pkg_lic_comment : PKG_LICS_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_LICS_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_lic_decl_1(self, p):
-        """pkg_lic_decl : PKG_LICS_DECL conc_license"""
-        try:
-            self.builder.set_pkg_license_declared(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageLicenseDeclared', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageLicenseDeclared', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_LICS_DECL_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_pkg_lic_decl_2(self, p):
-        """pkg_lic_decl : PKG_LICS_DECL error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_LICS_DECL_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_lic_ff_1(self, p):
-        """pkg_lic_ff : PKG_LICS_FFILE pkg_lic_ff_value"""
-        try:
-            self.builder.set_pkg_license_from_file(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageLicenseInfoFromFiles', 'PackageName', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_LIC_FFILE_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_pkg_lic_ff_value_1(self, p):
-        """pkg_lic_ff_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_pkg_lic_ff_value_2(self, p):
-        """pkg_lic_ff_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_pkg_lic_ff_value_3(self, p):
-        """pkg_lic_ff_value : LINE"""
-        if six.PY2:
-            value = p[1].decode(encoding='utf-8')
-        else:
-            value = p[1]
-        p[0] = document.License.from_identifier(value)
-
-    def p_pkg_lic_ff_2(self, p):
-        """pkg_lic_ff : PKG_LICS_FFILE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_LIC_FFILE_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_lic_conc_1(self, p):
-        """pkg_lic_conc : PKG_LICS_CONC conc_license"""
-        try:
-            self.builder.set_pkg_licenses_concluded(self.document, p[2])
-        except CardinalityError:
-            self.more_than_one_error('PackageLicenseConcluded', p.lineno(1))
-        except OrderError:
-            self.order_error('PackageLicenseConcluded', 'PackageFileName', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_LICS_CONC_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_pkg_lic_conc_2(self, p):
-        """pkg_lic_conc : PKG_LICS_CONC error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_LICS_CONC_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_src_info_1(self, p):
-        """pkg_src_info : PKG_SRC_INFO TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_source_info(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('PackageSourceInfo', p.lineno(1))
-        except OrderError:
-            self.order_error('PackageSourceInfo', 'PackageFileName', p.lineno(1))
-
-    def p_pkg_src_info_2(self, p):
-        """pkg_src_info : PKG_SRC_INFO error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_SRC_INFO_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_chksum_1(self, p):
-        """pkg_chksum : PKG_CHKSUM CHKSUM"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_chk_sum(self.document, value)
-        except OrderError:
-            self.order_error('PackageChecksum', 'PackageFileName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageChecksum', p.lineno(1))
-
-    def p_pkg_chksum_2(self, p):
-        """pkg_chksum : PKG_CHKSUM error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_CHKSUM_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_verif_1(self, p):
-        """pkg_verif : PKG_VERF_CODE LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_verif_code(self.document, value)
-        except OrderError:
-            self.order_error('PackageVerificationCode', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageVerificationCode', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_VERF_CODE_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_pkg_verif_2(self, p):
-        """pkg_verif : PKG_VERF_CODE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_VERF_CODE_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_home_1(self, p):
-        """pkg_home : PKG_HOME pkg_home_value"""
-        try:
-            self.builder.set_pkg_down_location(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageHomePage', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageHomePage', p.lineno(1))
-
-    def p_pkg_home_2(self, p):
-        """pkg_home : PKG_HOME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_HOME_VALUE']
-        self.logger.log(msg)
-
-    def p_pkg_home_value_1(self, p):
-        """pkg_home_value : LINE"""
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_pkg_home_value_2(self, p):
-        """pkg_home_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_pkg_home_value_3(self, p):
-        """pkg_home_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_pkg_down_location_1(self, p):
-        """pkg_down_location : PKG_DOWN pkg_down_value"""
-        try:
-            self.builder.set_pkg_down_location(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageDownloadLocation', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageDownloadLocation', p.lineno(1))
-
-    def p_pkg_down_location_2(self, p):
-        """pkg_down_location : PKG_DOWN error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_DOWN_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_down_value_1(self, p):
-        """pkg_down_value : LINE """
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_pkg_down_value_2(self, p):
-        """pkg_down_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_pkg_down_value_3(self, p):
-        """pkg_down_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_pkg_orig_1(self, p):
-        """pkg_orig : PKG_ORIG pkg_supplier_values"""
-        try:
-            self.builder.set_pkg_originator(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageOriginator', 'PackageName', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_ORIG_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-        except CardinalityError:
-            self.more_than_one_error('PackageOriginator', p.lineno(1))
-
-    def p_pkg_orig_2(self, p):
-        """pkg_orig : PKG_ORIG error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_ORIG_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_pkg_supplier_1(self, p):
-        """pkg_supplier : PKG_SUPPL pkg_supplier_values"""
-        try:
-            self.builder.set_pkg_supplier(self.document, p[2])
-        except OrderError:
-            self.order_error('PackageSupplier', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageSupplier', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['PKG_SUPPL_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_pkg_supplier_2(self, p):
-        """pkg_supplier : PKG_SUPPL error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_SUPPL_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
     def p_pkg_supplier_values_1(self, p):
         """pkg_supplier_values : NO_ASSERT"""
-        p[0] = utils.NoAssert()
+        p[0] = _NO_ASSERT
 
     def p_pkg_supplier_values_2(self, p):
         """pkg_supplier_values : entity"""
         p[0] = p[1]
 
-    def p_pkg_file_name(self, p):
-        """pkg_file_name : PKG_FILE_NAME LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_file_name(self.document, value)
-        except OrderError:
-            self.order_error('PackageFileName', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageFileName', p.lineno(1))
-
-    def p_pkg_file_name_1(self, p):
-        """pkg_file_name : PKG_FILE_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_FILE_NAME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_package_version_1(self, p):
-        """package_version : PKG_VERSION LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_pkg_vers(self.document, value)
-        except OrderError:
-            self.order_error('PackageVersion', 'PackageName', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('PackageVersion', p.lineno(1))
-
-    def p_package_version_2(self, p):
-        """package_version : PKG_VERSION error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PKG_VERSION_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_package_name(self, p):
-        """package_name : PKG_NAME LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.create_package(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('PackageName', p.lineno(1))
-
-    def p_package_name_1(self, p):
-        """package_name : PKG_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['PACKAGE_NAME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snip_spdx_id(self, p):
-        """snip_spdx_id : SNIPPET_SPDX_ID LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.create_snippet(self.document, value)
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_SPDX_ID_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
-
-    def p_snip_spdx_id_1(self, p):
-        """snip_spdx_id : SNIPPET_SPDX_ID error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_SPDX_ID_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_name(self, p):
-        """snip_name : SNIPPET_NAME LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_snippet_name(self.document, value)
-        except OrderError:
-            self.order_error('SnippetName', 'SnippetSPDXID', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('SnippetName', p.lineno(1))
-
-    def p_snippet_name_1(self, p):
-        """snip_name : SNIPPET_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIPPET_NAME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_comment(self, p):
-        """snip_comment : SNIPPET_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_snippet_comment(self.document, value)
-        except OrderError:
-            self.order_error('SnippetComment', 'SnippetSPDXID', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_COMMENT_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
-        except CardinalityError:
-            self.more_than_one_error('SnippetComment', p.lineno(1))
-
-    def p_snippet_comment_1(self, p):
-        """snip_comment : SNIPPET_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_cr_text(self, p):
-        """snip_cr_text : SNIPPET_CR_TEXT snip_cr_value"""
-        try:
-            self.builder.set_snippet_copyright(self.document, p[2])
-        except OrderError:
-            self.order_error('SnippetCopyrightText', 'SnippetSPDXID', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_COPYRIGHT_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
-        except CardinalityError:
-            self.more_than_one_error('SnippetCopyrightText', p.lineno(1))
-
-    def p_snippet_cr_text_1(self, p):
-        """snip_cr_text : SNIPPET_CR_TEXT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_COPYRIGHT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_cr_value_1(self, p):
-        """snip_cr_value : TEXT"""
-        if six.PY2:
-            p[0] = p[1].decode(encoding='utf-8')
-        else:
-            p[0] = p[1]
-
-    def p_snippet_cr_value_2(self, p):
-        """snip_cr_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_snippet_cr_value_3(self, p):
-        """snip_cr_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_snippet_lic_comment(self, p):
-        """snip_lic_comment : SNIPPET_LICS_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_snippet_lic_comment(self.document, value)
-        except OrderError:
-            self.order_error('SnippetLicenseComments', 'SnippetSPDXID', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_LICS_COMMENT_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
-        except CardinalityError:
-            self.more_than_one_error('SnippetLicenseComments', p.lineno(1))
-
-    def p_snippet_lic_comment_1(self, p):
-        """snip_lic_comment : SNIPPET_LICS_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_LICS_COMMENT_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snip_from_file_spdxid(self, p):
-        """snip_file_spdx_id : SNIPPET_FILE_SPDXID LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_snip_from_file_spdxid(self.document, value)
-        except OrderError:
-            self.order_error('SnippetFromFileSPDXID', 'SnippetSPDXID', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_FILE_SPDXID_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
-        except CardinalityError:
-            self.more_than_one_error('SnippetFromFileSPDXID', p.lineno(1))
-
-    def p_snip_from_file_spdxid_1(self, p):
-        """snip_file_spdx_id : SNIPPET_FILE_SPDXID error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_FILE_SPDXID_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_concluded_license(self, p):
-        """snip_lics_conc : SNIPPET_LICS_CONC conc_license"""
-        try:
-            self.builder.set_snip_concluded_license(self.document, p[2])
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_LICS_CONC_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-        except OrderError:
-            self.order_error('SnippetLicenseConcluded',
-                             'SnippetSPDXID', p.lineno(1))
-        except CardinalityError:
-            self.more_than_one_error('SnippetLicenseConcluded', p.lineno(1))
-
-    def p_snippet_concluded_license_1(self, p):
-        """snip_lics_conc : SNIPPET_LICS_CONC error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_LICS_CONC_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snippet_lics_info(self, p):
-        """snip_lics_info : SNIPPET_LICS_INFO snip_lic_info_value"""
-        try:
-            self.builder.set_snippet_lics_info(self.document, p[2])
-        except OrderError:
-            self.order_error(
-                'LicenseInfoInSnippet', 'SnippetSPDXID', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['SNIP_LICS_INFO_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-
-    def p_snippet_lics_info_1(self, p):
-        """snip_lics_info : SNIPPET_LICS_INFO error"""
-        self.error = True
-        msg = ERROR_MESSAGES['SNIP_LICS_INFO_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_snip_lic_info_value_1(self, p):
-        """snip_lic_info_value : NONE"""
-        p[0] = utils.SPDXNone()
-
-    def p_snip_lic_info_value_2(self, p):
-        """snip_lic_info_value : NO_ASSERT"""
-        p[0] = utils.NoAssert()
-
-    def p_snip_lic_info_value_3(self, p):
-        """snip_lic_info_value : LINE"""
-        if six.PY2:
-            value = p[1].decode(encoding='utf-8')
-        else:
-            value = p[1]
-        p[0] = document.License.from_identifier(value)
-
     def p_reviewer_1(self, p):
         """reviewer : REVIEWER entity"""
         self.builder.add_reviewer(self.document, p[2])
 
     def p_reviewer_2(self, p):
         """reviewer : REVIEWER error"""
-        self.error = True
-        msg = ERROR_MESSAGES['REVIEWER_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_review_date_1(self, p):
-        """review_date : REVIEW_DATE DATE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_review_date(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('ReviewDate', p.lineno(1))
-        except OrderError:
-            self.order_error('ReviewDate', 'Reviewer', p.lineno(1))
-
-    def p_review_date_2(self, p):
-        """review_date : REVIEW_DATE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['REVIEW_DATE_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_review_comment_1(self, p):
-        """review_comment : REVIEW_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_review_comment(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('ReviewComment', p.lineno(1))
-        except OrderError:
-            self.order_error('ReviewComment', 'Reviewer', p.lineno(1))
-
-    def p_review_comment_2(self, p):
-        """review_comment : REVIEW_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['REVIEW_COMMENT_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('REVIEWER_VALUE_TYPE', p.lineno(1))
 
     def p_annotator_1(self, p):
         """annotator : ANNOTATOR entity"""
@@ -1297,252 +626,79 @@ class Parser(object):
 
     def p_annotator_2(self, p):
         """annotator : ANNOTATOR error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ANNOTATOR_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_annotation_date_1(self, p):
-        """annotation_date : ANNOTATION_DATE DATE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_annotation_date(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('AnnotationDate', p.lineno(1))
-        except OrderError:
-            self.order_error('AnnotationDate', 'Annotator', p.lineno(1))
-
-    def p_annotation_date_2(self, p):
-        """annotation_date : ANNOTATION_DATE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ANNOTATION_DATE_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_annotation_comment_1(self, p):
-        """annotation_comment : ANNOTATION_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_annotation_comment(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('AnnotationComment', p.lineno(1))
-        except OrderError:
-            self.order_error('AnnotationComment', 'Annotator', p.lineno(1))
-
-    def p_annotation_comment_2(self, p):
-        """annotation_comment : ANNOTATION_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ANNOTATION_COMMENT_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_annotation_type_1(self, p):
-        """annotation_type : ANNOTATION_TYPE LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.add_annotation_type(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('AnnotationType', p.lineno(1))
-        except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['ANNOTATION_TYPE_VALUE'].format(p.lineno(1))
-            self.logger.log(msg)
-        except OrderError:
-            self.order_error('AnnotationType', 'Annotator', p.lineno(1))
-
-    def p_annotation_type_2(self, p):
-        """annotation_type : ANNOTATION_TYPE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ANNOTATION_TYPE_VALUE'].format(
-            p.lineno(1))
-        self.logger.log(msg)
-
-    def p_annotation_spdx_id_1(self, p):
-        """annotation_spdx_id : ANNOTATION_SPDX_ID LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_annotation_spdx_id(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('SPDXREF', p.lineno(1))
-        except OrderError:
-            self.order_error('SPDXREF', 'Annotator', p.lineno(1))
-
-    def p_annotation_spdx_id_2(self, p):
-        """annotation_spdx_id : ANNOTATION_SPDX_ID error"""
-        self.error = True
-        msg = ERROR_MESSAGES['ANNOTATION_SPDX_ID_VALUE'].format(
-            p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('ANNOTATOR_VALUE_TYPE', p.lineno(1))
 
     def p_lics_list_ver_1(self, p):
         """locs_list_ver : LIC_LIST_VER LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_lics_list_ver(self.document, value)
         except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['LIC_LIST_VER_VALUE'].format(
-                p[2], p.lineno(2))
-            self.logger.log(msg)
+            self.value_error('LIC_LIST_VER_VALUE', p[2], p.lineno(2))
         except CardinalityError:
             self.more_than_one_error('LicenseListVersion', p.lineno(1))
 
     def p_lics_list_ver_2(self, p):
         """locs_list_ver : LIC_LIST_VER error"""
-        self.error = True
-        msg = ERROR_MESSAGES['LIC_LIST_VER_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_doc_comment_1(self, p):
-        """doc_comment : DOC_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_doc_comment(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('DocumentComment', p.lineno(1))
-
-    def p_doc_comment_2(self, p):
-        """doc_comment : DOC_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['DOC_COMMENT_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('LIC_LIST_VER_VALUE_TYPE', p.lineno(1))
 
     def p_doc_namespace_1(self, p):
         """doc_namespace : DOC_NAMESPACE LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_doc_namespace(self.document, value)
         except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['DOC_NAMESPACE_VALUE'].format(p[2], p.lineno(2))
-            self.logger.log(msg)
+            self.value_error('DOC_NAMESPACE_VALUE', p[2], p.lineno(2))
         except CardinalityError:
             self.more_than_one_error('DocumentNamespace', p.lineno(1))
 
     def p_doc_namespace_2(self, p):
         """doc_namespace : DOC_NAMESPACE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['DOC_NAMESPACE_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('DOC_NAMESPACE_VALUE_TYPE', p.lineno(1))
 
     def p_data_license_1(self, p):
         """data_lics : DOC_LICENSE LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_doc_data_lics(self.document, value)
         except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['DOC_LICENSE_VALUE'].format(p[2], p.lineno(2))
-            self.logger.log(msg)
+            self.value_error('DOC_LICENSE_VALUE', p[2], p.lineno(2))
         except CardinalityError:
             self.more_than_one_error('DataLicense', p.lineno(1))
 
     def p_data_license_2(self, p):
         """data_lics : DOC_LICENSE error"""
-        self.error = True
-        msg = ERROR_MESSAGES['DOC_LICENSE_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_doc_name_1(self, p):
-        """doc_name : DOC_NAME LINE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_doc_name(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('DocumentName', p.lineno(1))
-
-    def p_doc_name_2(self, p):
-        """doc_name : DOC_NAME error"""
-        self.error = True
-        msg = ERROR_MESSAGES['DOC_NAME_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('DOC_LICENSE_VALUE_TYPE', p.lineno(1))
 
     def p_ext_doc_refs_1(self, p):
         """ext_doc_ref : EXT_DOC_REF DOC_REF_ID DOC_URI EXT_DOC_REF_CHKSUM"""
         try:
-            if six.PY2:
-                doc_ref_id = p[2].decode(encoding='utf-8')
-                doc_uri = p[3].decode(encoding='utf-8')
-                ext_doc_chksum = p[4].decode(encoding='utf-8')
-            else:
-                doc_ref_id = p[2]
-                doc_uri = p[3]
-                ext_doc_chksum = p[4]
+            doc_ref_id = p[2]
+            doc_uri = p[3]
+            ext_doc_chksum = p[4]
 
             self.builder.add_ext_doc_refs(self.document, doc_ref_id, doc_uri,
                                           ext_doc_chksum)
         except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['EXT_DOC_REF_VALUE'].format(p.lineno(2))
-            self.logger.log(msg)
+            self.value_error('EXT_DOC_REF_VALUE', p.lineno(2))
 
     def p_ext_doc_refs_2(self, p):
         """ext_doc_ref : EXT_DOC_REF error"""
-        self.error = True
-        msg = ERROR_MESSAGES['EXT_DOC_REF_VALUE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('EXT_DOC_REF_VALUE', p.lineno(1))
 
     def p_spdx_version_1(self, p):
         """spdx_version : DOC_VERSION LINE"""
         try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
+            value = p[2]
             self.builder.set_doc_version(self.document, value)
         except CardinalityError:
             self.more_than_one_error('SPDXVersion', p.lineno(1))
         except SPDXValueError:
-            self.error = True
-            msg = ERROR_MESSAGES['DOC_VERSION_VALUE'].format(p[2], p.lineno(1))
-            self.logger.log(msg)
+            self.value_error('DOC_VERSION_VALUE', p[2], p.lineno(1))
 
     def p_spdx_version_2(self, p):
         """spdx_version : DOC_VERSION error"""
-        self.error = True
-        msg = ERROR_MESSAGES['DOC_VERSION_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_creator_comment_1(self, p):
-        """creator_comment : CREATOR_COMMENT TEXT"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_creation_comment(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('CreatorComment', p.lineno(1))
-
-    def p_creator_comment_2(self, p):
-        """creator_comment : CREATOR_COMMENT error"""
-        self.error = True
-        msg = ERROR_MESSAGES['CREATOR_COMMENT_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
+        self.value_error('DOC_VERSION_VALUE_TYPE', p.lineno(1))
 
     def p_creator_1(self, p):
         """creator : CREATOR entity"""
@@ -1550,70 +706,19 @@ class Parser(object):
 
     def p_creator_2(self, p):
         """creator : CREATOR error"""
-        self.error = True
-        msg = ERROR_MESSAGES['CREATOR_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_created_1(self, p):
-        """created : CREATED DATE"""
-        try:
-            if six.PY2:
-                value = p[2].decode(encoding='utf-8')
-            else:
-                value = p[2]
-            self.builder.set_created_date(self.document, value)
-        except CardinalityError:
-            self.more_than_one_error('Created', p.lineno(1))
+        self.value_error('CREATOR_VALUE_TYPE', p.lineno(1))
 
-    def p_created_2(self, p):
-        """created : CREATED error"""
-        self.error = True
-        msg = ERROR_MESSAGES['CREATED_VALUE_TYPE'].format(p.lineno(1))
-        self.logger.log(msg)
-
-    def p_entity_1(self, p):
+    def p_entity(self, p):
         """entity : TOOL_VALUE
+                  | ORG_VALUE
+                  | PERSON_VALUE
         """
+        # The value token doubles as the error message key.
+        kind = p.slice[1].type
         try:
-            if six.PY2:
-                value = p[1].decode(encoding='utf-8')
-            else:
-                value = p[1]
-            p[0] = self.builder.build_tool(self.document, value)
+            p[0] = self.entity_builders[kind](self.document, p[1])
         except SPDXValueError:
-            msg = ERROR_MESSAGES['TOOL_VALUE'].format(p[1], p.lineno(1))
-            self.logger.log(msg)
-            self.error = True
-            p[0] = None
-
-    def p_entity_2(self, p):
-        """entity : ORG_VALUE
-        """
-        try:
-            if six.PY2:
-                value = p[1].decode(encoding='utf-8')
-            else:
-                value = p[1]
-            p[0] = self.builder.build_org(self.document, value)
-        except SPDXValueError:
-            msg = ERROR_MESSAGES['ORG_VALUE'].format(p[1], p.lineno(1))
-            self.logger.log(msg)
-            self.error = True
-            p[0] = None
-
-    def p_entity_3(self, p):
-        """entity : PERSON_VALUE
-        """
-        try:
-            if six.PY2:
-                value = p[1].decode(encoding='utf-8')
-            else:
-                value = p[1]
-            p[0] = self.builder.build_person(self.document, value)
-        except SPDXValueError:
-            msg = ERROR_MESSAGES['PERSON_VALUE'].format(p[1], p.lineno(1))
-            self.logger.log(msg)
-            self.error = True
+            self.value_error(kind, p[1], p.lineno(1))
             p[0] = None
 
     def p_error(self, p):
@@ -1621,22 +726,75 @@ class Parser(object):
 
     def build(self, **kwargs):
         self.lex = Lexer()
-        self.lex.build(reflags=re.UNICODE)
+        self.reset_lexer()
+        # Cache the tables as a pickle: loading a generated parsetab module
+        # means compiling it whenever its bytecode is not cached.
+        kwargs.setdefault('picklefile', PARSER_TABLES)
         self.yacc = yacc.yacc(module=self, **kwargs)
 
+    def reset_lexer(self):
+        """Returns a PLY lexer in its initial state, at line 1 with no input,
+        for a new document. Lexer.build only clones the lexer it compiled
+        once per process, so this is cheap.
+        """
+        self.lex.build(reflags=re.UNICODE)
+        return self.lex.lexer
+
     def parse(self, text):
+        # Hand yacc the PLY lexer itself so pulling a token is one call
+        # rather than going through the Lexer.token wrapper.
+        return self._parse(text, self.reset_lexer())
+
+    def parse_file(self, infile):
+        """Parses the document read from the text file object infile. The
+        lexer is fed a chunk at a time, so the whole text is never held in
+        memory at once.
+        """
+        lexer = self.reset_lexer()
+        lexer_token = lexer.token
+        chunks = _stream_chunks(infile)
+
+        def token():
+            tok = lexer_token()
+            while tok is None:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return None
+                lexer.input(chunk)
+                tok = lexer_token()
+            return tok
+
+        lexer.input('')
+        return self._parse(None, lexer, token)
+
+    def _parse(self, text, lexer, tokenfunc=None):
         self.document = document.Document()
         self.error = False
-        self.yacc.parse(text, lexer=self.lex)
-        # FIXME: this state does not make sense
-        self.builder.reset()
-        validation_messages = []
-        # Report extra errors if self.error is False otherwise there will be
-        # redundent messages
-        validation_messages = self.document.validate(validation_messages)
-        if not self.error:
-            if validation_messages:
-                for msg in validation_messages:
-                    self.logger.log(msg)
-                self.error = True
+        self.license_cache = {}
+        self.license_expr_cache = {}
+        try:
+            self.yacc.parse(text, lexer=lexer, tokenfunc=tokenfunc)
+            # Tokens are pulled one at a time, so the lexer's reference is
+            # the last one to the input; drop it so the whole text does not
+            # stay alive once parsing returns.
+            lexer.input('')
+            # FIXME: this state does not make sense
+            self.builder.reset()
+            # Only validate documents that parsed cleanly: otherwise the
+            # messages would repeat errors already reported, and they were
+            # never logged anyway.
+            if not self.error:
+                validation_messages = self.document.validate([])
+                if validation_messages:
+                    for msg in validation_messages:
+                        self.logger.log(msg)
+                    self.error = True
+        finally:
+            self.logger.flush()
         return self.document, self.error
+
+
+for _row in SETTER_RULES:
+    _value_rule, _error_rule = _setter_rules(*_row)
+    setattr(Parser, 'p_{0}_1'.format(_row[0]), _value_rule)
+    setattr(Parser, 'p_{0}_2'.format(_row[0]), _error_rule)
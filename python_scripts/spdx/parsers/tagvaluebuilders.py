@@ -36,13 +36,17 @@ from spdx.parsers.builderexceptions import SPDXValueError
 from spdx.parsers import validations
 
 
+# More constrained regex at lexer level
+CHECKSUM_RE = re.compile('SHA1:\s*([\S]+)', re.UNICODE)
+
+TEXT_RE = re.compile(r'<text>([\s\S]+)</text>', re.UNICODE)
+
+
 def checksum_from_sha1(value):
     """
     Return an spdx.checksum.Algorithm instance representing the SHA1
     checksum or None if does not match CHECKSUM_RE.
     """
-    # More constrained regex at lexer level
-    CHECKSUM_RE = re.compile('SHA1:\s*([\S]+)', re.UNICODE)
     match = CHECKSUM_RE.match(value)
     if match:
         return checksum.Algorithm(identifier='SHA1', value=match.group(1))
@@ -54,8 +58,7 @@ def str_from_text(text):
     """
     Return content of a free form text block as a string.
     """
-    REGEX = re.compile('<text>((.|\n)+)</text>', re.UNICODE)
-    match = REGEX.match(text)
+    match = TEXT_RE.match(text)
     if match:
         return match.group(1)
     else:
@@ -66,6 +69,11 @@ class DocBuilder(object):
     """
     Responsible for setting the fields of the top level document model.
     """
+    __slots__ = ()
+    # Set-once flags, stored in the slots declared by Builder.
+    FLAGS = ('doc_version_set', 'doc_comment_set', 'doc_namespace_set',
+             'doc_data_lics_set', 'doc_name_set', 'doc_spdx_id_set')
+
     VERS_STR_REGEX = re.compile(r'SPDX-(\d+)\.(\d+)', re.UNICODE)
 
     def __init__(self):
@@ -159,7 +167,7 @@ class DocBuilder(object):
             else:
                 raise SPDXValueError('Document::Namespace')
         else:
-            raise CardinalityError('Document::Comment')
+            raise CardinalityError('Document::Namespace')
 
     def reset_document(self):
         """Resets the state to allow building new documents"""
@@ -173,6 +181,7 @@ class DocBuilder(object):
 
 
 class ExternalDocumentRefBuilder(object):
+    __slots__ = ()
 
     def set_ext_doc_id(self, doc, ext_doc_id):
         """
@@ -208,6 +217,7 @@ class ExternalDocumentRefBuilder(object):
 
 
 class EntityBuilder(object):
+    __slots__ = ()
 
     tool_re = re.compile(r'Tool:\s*(.+)', re.UNICODE)
     person_re = re.compile(r'Person:\s*(([^(])+)(\((.*)\))?', re.UNICODE)
@@ -264,6 +274,8 @@ class EntityBuilder(object):
 
 
 class CreationInfoBuilder(object):
+    __slots__ = ()
+    FLAGS = ('created_date_set', 'creation_comment_set', 'lics_list_ver_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -337,6 +349,8 @@ class CreationInfoBuilder(object):
 
 
 class ReviewBuilder(object):
+    __slots__ = ()
+    FLAGS = ('review_date_set', 'review_comment_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -401,6 +415,9 @@ class ReviewBuilder(object):
 
 
 class AnnotationBuilder(object):
+    __slots__ = ()
+    FLAGS = ('annotation_date_set', 'annotation_comment_set',
+             'annotation_type_set', 'annotation_spdx_id_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -500,6 +517,15 @@ class AnnotationBuilder(object):
 
 
 class PackageBuilder(object):
+    __slots__ = ()
+    FLAGS = ('package_set', 'package_vers_set', 'package_file_name_set',
+             'package_supplier_set', 'package_originator_set',
+             'package_down_location_set', 'package_home_set',
+             'package_verif_set', 'package_chk_sum_set',
+             'package_source_info_set', 'package_conc_lics_set',
+             'package_license_declared_set', 'package_license_comment_set',
+             'package_cr_text_set', 'package_summary_set', 'package_desc_set')
+
     VERIF_CODE_REGEX = re.compile(r"([0-9a-f]+)\s*(\(\s*(.+)\))?", re.UNICODE)
     VERIF_CODE_CODE_GRP = 1
     VERIF_CODE_EXC_FILES_GRP = 3
@@ -808,6 +834,11 @@ class PackageBuilder(object):
 
 
 class FileBuilder(object):
+    __slots__ = ()
+    FLAGS = ('file_spdx_id_set', 'file_comment_set', 'file_type_set',
+             'file_chksum_set', 'file_conc_lics_set',
+             'file_license_comment_set', 'file_notice_set',
+             'file_copytext_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -1048,6 +1079,8 @@ class FileBuilder(object):
 
 
 class LicenseBuilder(object):
+    __slots__ = ()
+    FLAGS = ('extr_text_set', 'extr_lic_name_set', 'extr_lic_comment_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -1144,6 +1177,10 @@ class LicenseBuilder(object):
 
 
 class SnippetBuilder(object):
+    __slots__ = ()
+    FLAGS = ('snippet_spdx_id_set', 'snippet_name_set', 'snippet_comment_set',
+             'snippet_copyright_set', 'snippet_lic_comment_set',
+             'snip_file_spdxid_set', 'snippet_conc_lics_set')
 
     def __init__(self):
         # FIXME: this state does not make sense
@@ -1300,9 +1337,14 @@ class Builder(DocBuilder, CreationInfoBuilder, EntityBuilder, ReviewBuilder,
 
     """SPDX document builder."""
 
+    __slots__ = (DocBuilder.FLAGS + CreationInfoBuilder.FLAGS +
+                 ReviewBuilder.FLAGS + PackageBuilder.FLAGS +
+                 FileBuilder.FLAGS + LicenseBuilder.FLAGS +
+                 SnippetBuilder.FLAGS + AnnotationBuilder.FLAGS)
+
     def __init__(self):
-        super(Builder, self).__init__()
-        # FIXME: this state does not make sense
+        # reset() initializes the state of every base builder, so their
+        # __init__ methods are not chained through the MRO.
         self.reset()
 
     def reset(self):
@@ -24,12 +24,18 @@ from spdx import utils
 from spdx import document
 
 
+FREE_FORM_TEXT_RE = re.compile(r'<text>[\s\S]*</text>', re.UNICODE)
+FILE_SPDX_ID_RE = re.compile(r'SPDXRef-([A-Za-z0-9.\-]+)', re.UNICODE)
+SNIPPET_SPDX_ID_RE = re.compile(r'^SPDXRef[A-Za-z0-9.\-]+$')
+SNIP_FILE_SPDX_ID_RE = re.compile(
+    r'(DocumentRef[A-Za-z0-9.\-]+:){0,1}SPDXRef[A-Za-z0-9.\-]+')
+
+
 def validate_is_free_form_text(value, optional=False):
-    TEXT_RE = re.compile(r'<text>(.|\n)*</text>', re.UNICODE)
     if value is None:
         return optional
     else:
-        return TEXT_RE.match(value) is not None
+        return FREE_FORM_TEXT_RE.match(value) is not None
 
 
 def validate_tool_name(value, optional=False):
@@ -116,9 +122,8 @@ def validate_doc_spdx_id(value, optional=False):
 def validate_doc_namespace(value, optional=False):
     if value is None:
         return optional
-    elif ((value.startswith('http://') or value.startswith(
-            'https://') or
-           value.startswith('ftp://')) and ('#' not in value)):
+    elif (value.startswith(('http://', 'https://', 'ftp://')) and
+          ('#' not in value)):
         return True
     else:
         return False
@@ -169,11 +174,10 @@ def validate_pkg_lics_comment(value, optional=False):
 
 def validate_file_spdx_id(value, optional=False):
     value = value.split('#')[-1]
-    TEXT_RE = re.compile(r'SPDXRef-([A-Za-z0-9.\-]+)', re.UNICODE)
     if value is None:
         return optional
     else:
-        return TEXT_RE.match(value) is not None
+        return FILE_SPDX_ID_RE.match(value) is not None
 
 
 def validate_file_comment(value, optional=False):
@@ -239,7 +243,7 @@ def validate_extr_lic_name(value, optional=False):
 
 def validate_snippet_spdx_id(value, optional=False):
     value = value.split('#')[-1]
-    if re.match(r'^SPDXRef[A-Za-z0-9.\-]+$', value) is not None:
+    if SNIPPET_SPDX_ID_RE.match(value) is not None:
         return True
     else:
         return False
@@ -265,8 +269,7 @@ def validate_snip_lic_comment(value, optional=False):
 
 
 def validate_snip_file_spdxid(value, optional=False):
-    if re.match(
-            r'(DocumentRef[A-Za-z0-9.\-]+:){0,1}SPDXRef[A-Za-z0-9.\-]+', value) is not None:
+    if SNIP_FILE_SPDX_ID_RE.match(value) is not None:
         return True
     else:
         return False
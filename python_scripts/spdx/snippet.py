@@ -9,12 +9,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import six
-
 from spdx import document
 from spdx import utils
 
 
+# Types accepted for the copyright text and for each license of a snippet.
+_COPYRIGHT_TYPES = (str, utils.NoAssert, utils.SPDXNone)
+_LICENSE_TYPES = (document.License, utils.NoAssert, utils.SPDXNone)
+_LICENSE_TYPE_SET = frozenset(_LICENSE_TYPES)
+
+
 class Snippet(object):
     """
     Represents an analyzed snippet.
@@ -39,6 +43,10 @@ class Snippet(object):
      utils.NoAssert.
     """
 
+    # Documents can hold many snippets; slots keep each one small.
+    __slots__ = ('spdx_id', 'name', 'comment', 'copyright', 'license_comment',
+                 'snip_from_file_spdxid', 'conc_lics', 'licenses_in_snippet')
+
     def __init__(self, spdx_id=None, copyright=None,
                  snip_from_file_spdxid=None, conc_lics=None):
         self.spdx_id = spdx_id
@@ -58,60 +66,50 @@ class Snippet(object):
         Validate fields of the snippet and update the messages list with user
         friendly error messages for display.
         """
-        messages = self.validate_spdx_id(messages)
-        messages = self.validate_copyright_text(messages)
-        messages = self.validate_snip_from_file_spdxid(messages)
-        messages = self.validate_concluded_license(messages)
-        messages = self.validate_licenses_in_snippet(messages)
+        # Messages are appended in place rather than concatenated, so that
+        # reporting n problems stays linear.
+        if messages is None:
+            messages = []
+        self.validate_spdx_id(messages)
+        self.validate_copyright_text(messages)
+        self.validate_snip_from_file_spdxid(messages)
+        self.validate_concluded_license(messages)
+        self.validate_licenses_in_snippet(messages)
         
         return messages
 
-    def validate_spdx_id(self, messages=None):
+    def validate_spdx_id(self, messages):
         if self.spdx_id is None:
-            messages = messages + ['Snippet has no SPDX Identifier.']
-        
-        return messages
+            messages.append('Snippet has no SPDX Identifier.')
 
-    def validate_copyright_text(self, messages=None):
-        if not isinstance(
-            self.copyright,
-                (six.string_types, six.text_type, utils.NoAssert,
-                 utils.SPDXNone)):
-            messages = messages + [
-                'Snippet copyright must be str or unicode or utils.NoAssert or utils.SPDXNone'
-            ]
-        
-        return messages
+    def validate_copyright_text(self, messages):
+        # Exact type first; isinstance only for the uncommon subclasses.
+        if (type(self.copyright) is not str and
+                not isinstance(self.copyright, _COPYRIGHT_TYPES)):
+            messages.append(
+                'Snippet copyright must be str or unicode or utils.NoAssert or utils.SPDXNone')
 
-    def validate_snip_from_file_spdxid(self, messages=None):
+    def validate_snip_from_file_spdxid(self, messages):
         if self.snip_from_file_spdxid is None:
-            messages = messages + ['Snippet has no Snippet from File SPDX Identifier.']
-        
-        return messages
+            messages.append('Snippet has no Snippet from File SPDX Identifier.')
 
-    def validate_concluded_license(self, messages=None):
-        if not isinstance(self.conc_lics, (document.License, utils.NoAssert,
-                                       utils.SPDXNone)):
-            messages = messages + [
+    def validate_concluded_license(self, messages):
+        if (type(self.conc_lics) is not document.License and
+                not isinstance(self.conc_lics, _LICENSE_TYPES)):
+            messages.append(
                 'Snippet Concluded License must be one of '
-                'document.License, utils.NoAssert or utils.SPDXNone'
-            ]
-        
-        return messages
+                'document.License, utils.NoAssert or utils.SPDXNone')
 
-    def validate_licenses_in_snippet(self, messages=None):
-        if len(self.licenses_in_snippet) == 0:
-            messages = messages + ['Snippet must have at least one license in file.']
-        else:
-            for lic in self.licenses_in_snippet:
-                if not isinstance(lic, (document.License, utils.NoAssert,
-                                        utils.SPDXNone)):
-                    messages = messages + [
-                        'Licenses in Snippet must be one of '
-                        'document.License, utils.NoAssert or utils.SPDXNone'
-                    ]
-        
-        return messages
+    def validate_licenses_in_snippet(self, messages):
+        if not self.licenses_in_snippet:
+            messages.append('Snippet must have at least one license in file.')
+        elif not all(type(lic) in _LICENSE_TYPE_SET or
+                     isinstance(lic, _LICENSE_TYPES)
+                     for lic in self.licenses_in_snippet):
+            # Reported once, however many licenses are wrong.
+            messages.append(
+                'Licenses in Snippet must be one of '
+                'document.License, utils.NoAssert or utils.SPDXNone')
 
     def has_optional_field(self, field):
         return getattr(self, field, None) is not None
\ No newline at end of file
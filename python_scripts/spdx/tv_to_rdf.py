@@ -32,8 +32,7 @@ def tv_to_rdf(infile_name, outfile_name):
     parser = Parser(Builder(), StandardLogger())
     parser.build()
     with open(infile_name) as infile:
-        data = infile.read()
-        document, error = parser.parse(data)
+        document, error = parser.parse_file(infile)
         if not error:
             with open(outfile_name, mode='w') as outfile:
                 write_document(document, outfile)
@@ -17,8 +17,6 @@ from __future__ import unicode_literals
 import datetime
 import re
 
-from ply import yacc, lex
-
 from spdx import document
 
 
@@ -95,102 +93,93 @@ class SPDXNone(object):
         return self.to_value()
 
 
-class LicenseListLexer(object):
-
-    tokens = ['LP', 'RP', 'AND', 'OR', 'LICENSE']
-
-    def t_LP(self, t):
-        r'\('
-        return t
-
-    def t_RP(self, t):
-        r'\)'
-        return t
-
-    def t_AND(self, t):
-        r'\s(and|AND)\s'
-        t.value = t.value.strip()
-        return t
-
-    def t_OR(self, t):
-        r'\s(or|OR)\s'
-        t.value = t.value.strip()
-        return t
-
-    def t_whitespace(self, t):
-        r'\s+'
-        pass
-
-    def t_LICENSE(self, t):
-        r'[A-Za-z.0-9\-+]+'
-        t.value = t.value.strip()
-        return t
-
-    def t_error(self, t):
-        pass
-
-    def input(self, data):
-        """Set input, data - str."""
-        self.lexer.input(data)
-
-    def token(self):
-        """Get the next token or None if exhausted input."""
-        return self.lexer.token()
-
-    def build(self, **kwargs):
-        """Build lexer, must be called before input or token methods.
-        Only need to build once.
-        """
-        self.lexer = lex.lex(module=self, **kwargs)
-
+# Tokens of a license list, tried in order at each position. AND and OR
+# are only operators when surrounded by whitespace, otherwise they are
+# read as license identifiers.
+LICENSE_LIST_TOKEN_REGEX = re.compile(
+    r'(?P<LP>\()|(?P<RP>\))|\s(?P<AND>and|AND)\s|\s(?P<OR>or|OR)\s'
+    r'|(?P<WS>\s+)|(?P<LICENSE>[A-Za-z.0-9\-+]+)', re.UNICODE)
 
-class LicenseListParser(object):
+# Binding strength of the license list operators, both left associative.
+LICENSE_LIST_PRECEDENCE = {'AND': 2, 'OR': 1}
 
-    def __init__(self):
-        self.lex = LicenseListLexer()
-        self.lex.build(reflags=re.UNICODE)
-        self.tokens = self.lex.tokens
 
-    def p_disjunction_1(self, p):
-        """disjunction : disjunction OR conjunction
-        """
-        p[0] = document.LicenseDisjunction(p[1], p[3])
-
-    def p_disjunction_2(self, p):
-        """disjunction : conjunction
-        """
-        p[0] = p[1]
-
-    def p_conjunction_1(self, p):
-        """conjunction : conjunction AND license_atom
-        """
-        p[0] = document.LicenseConjunction(p[1], p[3])
-
-    def p_conjunction_2(self, p):
-        """conjunction : license_atom
-        """
-        p[0] = p[1]
-
-    def p_license_atom_1(self, p):
-        """license_atom : LICENSE
-        """
-        p[0] = document.License.from_identifier(p[1])
-
-    def p_license_atom_2(self, p):
-        """license_atom : LP disjunction RP
-        """
-        p[0] = p[2]
-
-    def p_error(self, p):
-        pass
+def _license_list_tokens(data):
+    """
+    Yield (type, value) for every token in the license list data.
+    Raise ValueError on a character that starts no token.
+    """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        match = LICENSE_LIST_TOKEN_REGEX.match(data, pos)
+        if match is None:
+            raise ValueError(data[pos:])
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != 'WS':
+            yield kind, match.group(kind)
+
+
+def _reduce_license_list(operands, operator):
+    right = operands.pop()
+    left = operands.pop()
+    if operator == 'AND':
+        operands.append(document.LicenseConjunction(left, right))
+    else:
+        operands.append(document.LicenseDisjunction(left, right))
 
-    def build(self, **kwargs):
-        """Must be called before parse."""
-        self.yacc = yacc.yacc(module=self, **kwargs)
 
-    def parse(self, data):
-        """Parses a license list and returns a License or None if it failed."""
-        try:
-            return self.yacc.parse(data, lexer=self.lex)
-        except:
-            return None
+def parse_license_list(data):
+    """
+    Parse a license list such as "(MIT OR Apache-2.0) AND LicenseRef-1"
+    with a shunting-yard pass and return the License tree, AND binding
+    tighter than OR. Return None if data is not a license list.
+    A token that cannot continue the expression discards everything read
+    so far and parsing starts over after it, so only the part after the
+    last such token is returned.
+    """
+    operands = []
+    operators = []
+    depth = 0
+    expect_operand = True
+    try:
+        tokens = list(_license_list_tokens(data))
+    except ValueError:
+        return None
+    for kind, value in tokens:
+        if expect_operand:
+            valid = kind == 'LICENSE' or kind == 'LP'
+        else:
+            valid = kind != 'LICENSE' and kind != 'LP' and (
+                kind != 'RP' or depth > 0)
+        if not valid:
+            del operands[:]
+            del operators[:]
+            depth = 0
+            expect_operand = True
+            continue
+        if kind == 'LICENSE':
+            operands.append(document.License.from_identifier(value))
+            expect_operand = False
+        elif kind == 'LP':
+            operators.append(kind)
+            depth += 1
+        elif kind == 'RP':
+            operator = operators.pop()
+            while operator != 'LP':
+                _reduce_license_list(operands, operator)
+                operator = operators.pop()
+            depth -= 1
+        else:
+            precedence = LICENSE_LIST_PRECEDENCE[kind]
+            while (operators and operators[-1] != 'LP' and
+                   LICENSE_LIST_PRECEDENCE[operators[-1]] >= precedence):
+                _reduce_license_list(operands, operators.pop())
+            operators.append(kind)
+            expect_operand = True
+    if expect_operand or depth:
+        return None
+    while operators:
+        _reduce_license_list(operands, operators.pop())
+    return operands[0]
@@ -15,6 +15,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import uuid
+from functools import lru_cache
 
 from rdflib import BNode
 from rdflib import Graph
@@ -24,6 +25,7 @@ from rdflib import RDF
 from rdflib import RDFS
 from rdflib import URIRef
 from rdflib.compare import to_isomorphic
+from rdflib.plugins.serializers.nt import _nt_row
 
 from spdx import file
 from spdx import document
@@ -32,40 +34,99 @@ from spdx import utils
 from spdx.writers.tagvalue import InvalidDocumentError
 
 
+class _CachedNamespace(Namespace):
+    """
+    Namespace that stores each term on first attribute access, so later
+    lookups are plain instance attribute reads instead of new URIRefs.
+    """
+
+    def __getattr__(self, name):
+        term = super(_CachedNamespace, self).__getattr__(name)
+        setattr(self, name, term)
+        return term
+
+
+class _NTriplesSink(object):
+    """
+    Stand-in for the writer's Graph that writes every triple straight to
+    `out` as N-Triples instead of storing it.
+    """
+
+    def __init__(self, out):
+        self.out = out
+
+    def addN(self, quads):
+        rows = ''.join(_nt_row((s, p, o)) for s, p, o, _ in quads)
+        self.out.write(rows.encode('utf-8'))
+
+
 class BaseWriter(object):
     """
     Base class for all Writer classes.
     Provides utility functions and stores shared fields.
     """
 
+    __slots__ = ('document', 'out', 'doap_namespace', 'spdx_namespace', 'graph',
+                 '_special_values', '_lit', '_file_node_by_name',
+                 '_extracted_license_by_id', '_extracted_by_id', '_bnode_counter')
+
     def __init__(self, document, out):
         self.document = document
         self.out = out
-        self.doap_namespace = Namespace('http://usefulinc.com/ns/doap#')
-        self.spdx_namespace = Namespace("http://spdx.org/rdf/terms#")
-        self.graph = Graph()
+        self.doap_namespace = _CachedNamespace('http://usefulinc.com/ns/doap#')
+        self.spdx_namespace = _CachedNamespace("http://spdx.org/rdf/terms#")
+        # The writer only adds triples and never queries the graph, so the
+        # context-free store is enough and cheaper per add than the default.
+        self.graph = Graph(store='SimpleMemory')
+        # Terms for the NOASSERTION/NONE special values, keyed by exact type.
+        self._special_values = {
+            utils.NoAssert: self.spdx_namespace.noassertion,
+            utils.SPDXNone: self.spdx_namespace.none,
+        }
+        # Shared Literal for values that repeat across nodes (checksum
+        # algorithms, contributors, ...).
+        self._lit = lru_cache(maxsize=4096)(Literal)
+        # Nodes already written, so later references don't have to query the graph.
+        self._file_node_by_name = {}
+        self._extracted_license_by_id = {}
+        # document.extracted_licenses keyed by identifier, built on first use.
+        self._extracted_by_id = None
+        self._bnode_counter = 0
+
+    def _emit(self, triples):
+        """
+        Add all of `triples` to the graph with a single addN call.
+        """
+        graph = self.graph
+        graph.addN((s, p, o, graph) for s, p, o in triples)
+
+    def _bnode(self):
+        """
+        Return a new blank node. Ids only need to be unique within this
+        graph, so a counter is used instead of rdflib's uuid4 per node.
+        """
+        self._bnode_counter += 1
+        return BNode('b%d' % self._bnode_counter)
 
     def create_checksum_node(self, chksum):
         """
         Return a node representing spdx.checksum.
         """
-        chksum_node = BNode()
-        type_triple = (chksum_node, RDF.type, self.spdx_namespace.Checksum)
-        self.graph.add(type_triple)
-        algorithm_triple = (chksum_node, self.spdx_namespace.algorithm, Literal(chksum.identifier))
-        self.graph.add(algorithm_triple)
-        value_triple = (chksum_node, self.spdx_namespace.checksumValue, Literal(chksum.value))
-        self.graph.add(value_triple)
+        chksum_node = self._bnode()
+        self._emit([
+            (chksum_node, RDF.type, self.spdx_namespace.Checksum),
+            (chksum_node, self.spdx_namespace.algorithm, self._lit(chksum.identifier)),
+            (chksum_node, self.spdx_namespace.checksumValue, Literal(chksum.value)),
+        ])
         return chksum_node
 
     def to_special_value(self, value):
         """
         Return proper spdx term or Literal
         """
-        if isinstance(value, utils.NoAssert):
-            return self.spdx_namespace.noassertion
-        elif isinstance(value, utils.SPDXNone):
-            return self.spdx_namespace.none
+        special = self._special_values.get(type(value))
+        if special is not None:
+            return special
         else:
             return Literal(value)
 
@@ -75,17 +136,11 @@ class LicenseWriter(BaseWriter):
     Handle all License classes from spdx.document module.
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(LicenseWriter, self).__init__(document, out)
 
-    def licenses_from_tree_helper(self, current, licenses):
-        if (isinstance(current, (document.LicenseConjunction,
-                                 document.LicenseDisjunction))):
-            self.licenses_from_tree_helper(current.license_1, licenses)
-            self.licenses_from_tree_helper(current.license_2, licenses)
-        else:
-            licenses.add(self.create_license_helper(current))
-
     def licenses_from_tree(self, tree):
         """
         Traverse conjunctions and disjunctions like trees and return a
@@ -93,33 +148,40 @@ class LicenseWriter(BaseWriter):
         """
         # FIXME: this is unordered!
         licenses = set()
-        self.licenses_from_tree_helper(tree, licenses)
+        conjunction, disjunction = document.LicenseConjunction, document.LicenseDisjunction
+        stack = [tree]
+        while stack:
+            current = stack.pop()
+            current_type = type(current)
+            if current_type is conjunction or current_type is disjunction:
+                stack.append(current.license_2)
+                stack.append(current.license_1)
+            else:
+                licenses.add(self.create_license_helper(current))
         return licenses
 
     def create_conjunction_node(self, conjunction):
         """
         Return a node representing a conjunction of licenses.
         """
-        node = BNode()
-        type_triple = (node, RDF.type, self.spdx_namespace.ConjunctiveLicenseSet)
-        self.graph.add(type_triple)
+        node = self._bnode()
+        triples = [(node, RDF.type, self.spdx_namespace.ConjunctiveLicenseSet)]
         licenses = self.licenses_from_tree(conjunction)
-        for lic in licenses:
-            member_triple = (node, self.spdx_namespace.member, lic)
-            self.graph.add(member_triple)
+        member_predicate = self.spdx_namespace.member
+        triples.extend((node, member_predicate, lic) for lic in licenses)
+        self._emit(triples)
         return node
 
     def create_disjunction_node(self, disjunction):
         """
         Return a node representing a disjunction of licenses.
         """
-        node = BNode()
-        type_triple = (node, RDF.type, self.spdx_namespace.DisjunctiveLicenseSet)
-        self.graph.add(type_triple)
+        node = self._bnode()
+        triples = [(node, RDF.type, self.spdx_namespace.DisjunctiveLicenseSet)]
         licenses = self.licenses_from_tree(disjunction)
-        for lic in licenses:
-            member_triple = (node, self.spdx_namespace.member, lic)
-            self.graph.add(member_triple)
+        member_predicate = self.spdx_namespace.member
+        triples.extend((node, member_predicate, lic) for lic in licenses)
+        self._emit(triples)
         return node
 
     def create_license_helper(self, lic):
@@ -132,9 +194,13 @@ class LicenseWriter(BaseWriter):
         if lic.identifier.rstrip('+') in config.LICENSE_MAP:
             return URIRef(lic.url)
         else:
-            matches = [l for l in self.document.extracted_licenses if l.identifier == lic.identifier]
-            if len(matches) != 0:
-                return self.create_extracted_license(matches[0])
+            if self._extracted_by_id is None:
+                self._extracted_by_id = {}
+                for extracted in self.document.extracted_licenses:
+                    self._extracted_by_id.setdefault(extracted.identifier, extracted)
+            match = self._extracted_by_id.get(lic.identifier)
+            if match is not None:
+                return self.create_extracted_license(match)
             else:
                 raise InvalidDocumentError('Missing extracted license: {0}'.format(lic.identifier))
 
@@ -143,26 +209,24 @@ class LicenseWriter(BaseWriter):
         Handle extracted license.
         Return the license node.
         """
-        licenses = list(self.graph.triples((None, self.spdx_namespace.licenseId, lic.identifier)))
-        if len(licenses) != 0:
-            return licenses[0][0]  # return subject in first triple
+        license_node = self._extracted_license_by_id.get(lic.identifier)
+        if license_node is not None:
+            return license_node
         else:
-            license_node = BNode()
-            type_triple = (license_node, RDF.type, self.spdx_namespace.ExtractedLicensingInfo)
-            self.graph.add(type_triple)
-            ident_triple = (license_node, self.spdx_namespace.licenseId, Literal(lic.identifier))
-            self.graph.add(ident_triple)
-            text_triple = (license_node, self.spdx_namespace.extractedText, Literal(lic.text))
-            self.graph.add(text_triple)
+            license_node = self._bnode()
+            self._extracted_license_by_id[lic.identifier] = license_node
+            triples = [
+                (license_node, RDF.type, self.spdx_namespace.ExtractedLicensingInfo),
+                (license_node, self.spdx_namespace.licenseId, Literal(lic.identifier)),
+                (license_node, self.spdx_namespace.extractedText, Literal(lic.text)),
+            ]
             if lic.full_name is not None:
-                name_triple = (license_node, self.spdx_namespace.licenseName, self.to_special_value(lic.full_name))
-                self.graph.add(name_triple)
+                triples.append((license_node, self.spdx_namespace.licenseName, self.to_special_value(lic.full_name)))
             for ref in lic.cross_ref:
-                triple = (license_node, RDFS.seeAlso, URIRef(ref))
-                self.graph.add(triple)
+                triples.append((license_node, RDFS.seeAlso, URIRef(ref)))
             if lic.comment is not None:
-                comment_triple = (license_node, RDFS.comment, Literal(lic.comment))
-                self.graph.add(comment_triple)
+                triples.append((license_node, RDFS.comment, Literal(lic.comment)))
+            self._emit(triples)
             return license_node
 
     def create_license_node(self, lic):
@@ -171,9 +235,10 @@ class LicenseWriter(BaseWriter):
         Could be a single license (extracted or part of license list.) or
         a conjunction/disjunction of licenses.
         """
-        if isinstance(lic, document.LicenseConjunction):
+        lic_type = type(lic)
+        if lic_type is document.LicenseConjunction:
             return self.create_conjunction_node(lic)
-        elif isinstance(lic, document.LicenseDisjunction):
+        elif lic_type is document.LicenseDisjunction:
             return self.create_disjunction_node(lic)
         else:
             return self.create_license_helper(lic)
@@ -184,10 +249,9 @@ class LicenseWriter(BaseWriter):
         Return the term for the special value or the result of passing
         license to create_license_node.
         """
-        if isinstance(lic, utils.NoAssert):
-            return self.spdx_namespace.noassertion
-        elif isinstance(lic, utils.SPDXNone):
-            return self.spdx_namespace.none
+        special = self._special_values.get(type(lic))
+        if special is not None:
+            return special
         else:
             return self.create_license_node(lic)
 
@@ -196,12 +260,19 @@ class FileWriter(LicenseWriter):
     """
     Write spdx.file.File
     """
+
+    __slots__ = ()
+
     FILE_TYPES = {
         file.FileType.SOURCE: 'fileType_source',
         file.FileType.OTHER: 'fileType_other',
         file.FileType.BINARY: 'fileType_binary',
         file.FileType.ARCHIVE: 'fileType_archive'
     }
+    FILE_TYPE_URIS = {
+        ftype: URIRef('http://spdx.org/rdf/terms#' + suffix)
+        for ftype, suffix in FILE_TYPES.items()
+    }
 
     def __init__(self, document, out):
         super(FileWriter, self).__init__(document, out)
@@ -212,74 +283,66 @@ class FileWriter(LicenseWriter):
         """
         file_node = URIRef('http://www.spdx.org/files#{id}'.format(
             id=str(doc_file.spdx_id)))
-        type_triple = (file_node, RDF.type, self.spdx_namespace.File)
-        self.graph.add(type_triple)
-
-        name_triple = (file_node, self.spdx_namespace.fileName, Literal(doc_file.name))
-        self.graph.add(name_triple)
+        self._file_node_by_name[doc_file.name] = file_node
+        triples = [
+            (file_node, RDF.type, self.spdx_namespace.File),
+            (file_node, self.spdx_namespace.fileName, Literal(doc_file.name)),
+        ]
 
         if doc_file.has_optional_field('comment'):
-            comment_triple = (file_node, RDFS.comment, Literal(doc_file.comment))
-            self.graph.add(comment_triple)
+            triples.append((file_node, RDFS.comment, Literal(doc_file.comment)))
 
         if doc_file.has_optional_field('type'):
-            ftype = self.spdx_namespace[self.FILE_TYPES[doc_file.type]]
-            ftype_triple = (file_node, self.spdx_namespace.fileType, ftype)
-            self.graph.add(ftype_triple)
+            triples.append((file_node, self.spdx_namespace.fileType, self.FILE_TYPE_URIS[doc_file.type]))
 
-        self.graph.add((file_node, self.spdx_namespace.checksum, self.create_checksum_node(doc_file.chk_sum)))
+        triples.append((file_node, self.spdx_namespace.checksum, self.create_checksum_node(doc_file.chk_sum)))
 
         conc_lic_node = self.license_or_special(doc_file.conc_lics)
-        conc_lic_triple = (file_node, self.spdx_namespace.licenseConcluded, conc_lic_node)
-        self.graph.add(conc_lic_triple)
+        triples.append((file_node, self.spdx_namespace.licenseConcluded, conc_lic_node))
 
         license_info_nodes = map(self.license_or_special, doc_file.licenses_in_file)
-        for lic in license_info_nodes:
-            triple = (file_node, self.spdx_namespace.licenseInfoInFile, lic)
-            self.graph.add(triple)
+        lic_info_predicate = self.spdx_namespace.licenseInfoInFile
+        triples.extend((file_node, lic_info_predicate, lic) for lic in license_info_nodes)
 
         if doc_file.has_optional_field('license_comment'):
-            comment_triple = (file_node, self.spdx_namespace.licenseComments, Literal(doc_file.license_comment))
-            self.graph.add(comment_triple)
+            triples.append((file_node, self.spdx_namespace.licenseComments, Literal(doc_file.license_comment)))
 
         cr_text_node = self.to_special_value(doc_file.copyright)
-        cr_text_triple = (file_node, self.spdx_namespace.copyrightText, cr_text_node)
-        self.graph.add(cr_text_triple)
+        triples.append((file_node, self.spdx_namespace.copyrightText, cr_text_node))
 
         if doc_file.has_optional_field('notice'):
-            notice_triple = (file_node, self.spdx_namespace.noticeText, doc_file.notice)
-            self.graph.add(notice_triple)
+            triples.append((file_node, self.spdx_namespace.noticeText, doc_file.notice))
 
-        contrib_nodes = map(lambda c: Literal(c), doc_file.contributors)
-        contrib_triples = [(file_node, self.spdx_namespace.fileContributor, node) for node in contrib_nodes]
-        for triple in contrib_triples:
-            self.graph.add(triple)
+        contrib_predicate = self.spdx_namespace.fileContributor
+        triples.extend((file_node, contrib_predicate, self._lit(contributor))
+                       for contributor in doc_file.contributors)
 
+        self._emit(triples)
         return file_node
 
     def files(self):
         """
         Return list of file nodes.
         """
-        return map(self.create_file_node, self.document.files)
+        return list(map(self.create_file_node, self.document.files))
 
     def add_file_dependencies_helper(self, doc_file):
         """
         Handle dependencies for a single file.
         - doc_file - instance of spdx.file.File.
         """
-        subj_triples = list(self.graph.triples((None, self.spdx_namespace.fileName, Literal(doc_file.name))))
-        if len(subj_triples) != 1:
+        subject_node = self._file_node_by_name.get(doc_file.name)
+        if subject_node is None:
             raise InvalidDocumentError('Could not find dependency subject {0}'.format(doc_file.name))
-        subject_node = subj_triples[0][0]
+        triples = []
+        dep_predicate = self.spdx_namespace.fileDependency
         for dependency in doc_file.dependencies:
-            dep_triples = list(self.graph.triples((None, self.spdx_namespace.fileName, Literal(dependency))))
-            if len(dep_triples) == 1:
-                dep_node = dep_triples[0][0]
-                dep_triple = (subject_node, self.spdx_namespace.fileDependency, dep_node)
-                self.graph.add(dep_triple)
+            dep_node = self._file_node_by_name.get(dependency)
+            if dep_node is not None:
+                triples.append((subject_node, dep_predicate, dep_node))
             else:
                 print('Warning could not resolve file dependency {0} -> {1}'.format(doc_file.name, dependency))
+        self._emit(triples)
 
     def add_file_dependencies(self):
         """
@@ -296,6 +359,8 @@ class SnippetWriter(LicenseWriter):
     Write spdx.snippet.Snippet
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(SnippetWriter, self).__init__(document, out)
 
@@ -304,49 +369,40 @@ class SnippetWriter(LicenseWriter):
         Return a snippet node.
         """
         snippet_node = URIRef('http://spdx.org/rdf/terms/Snippet#' + snippet.spdx_id)
-        type_triple = (snippet_node, RDF.type, self.spdx_namespace.Snippet)
-        self.graph.add(type_triple)
+        triples = [(snippet_node, RDF.type, self.spdx_namespace.Snippet)]
 
         if snippet.has_optional_field('comment'):
-            comment_triple = (snippet_node, RDFS.comment, Literal(snippet.comment))
-            self.graph.add(comment_triple)
+            triples.append((snippet_node, RDFS.comment, Literal(snippet.comment)))
 
         if snippet.has_optional_field('name'):
-            name_triple = (snippet_node, self.spdx_namespace.name, Literal(snippet.name))
-            self.graph.add(name_triple)
+            triples.append((snippet_node, self.spdx_namespace.name, Literal(snippet.name)))
 
         if snippet.has_optional_field('license_comment'):
-            lic_comment_triple = (snippet_node, self.spdx_namespace.licenseComments,
-                                  Literal(snippet.license_comment))
-            self.graph.add(lic_comment_triple)
+            triples.append((snippet_node, self.spdx_namespace.licenseComments,
+                            Literal(snippet.license_comment)))
 
         cr_text_node = self.to_special_value(snippet.copyright)
-        cr_text_triple = (snippet_node, self.spdx_namespace.copyrightText, cr_text_node)
-        self.graph.add(cr_text_triple)
+        triples.append((snippet_node, self.spdx_namespace.copyrightText, cr_text_node))
 
-        snip_from_file_triple = (snippet_node, self.spdx_namespace.snippetFromFile,
-                                 Literal(snippet.snip_from_file_spdxid))
-        self.graph.add(snip_from_file_triple)
+        triples.append((snippet_node, self.spdx_namespace.snippetFromFile,
+                        self._lit(snippet.snip_from_file_spdxid)))
 
         conc_lic_node = self.license_or_special(snippet.conc_lics)
-        conc_lic_triple = (
-            snippet_node, self.spdx_namespace.licenseConcluded, conc_lic_node)
-        self.graph.add(conc_lic_triple)
+        triples.append((snippet_node, self.spdx_namespace.licenseConcluded, conc_lic_node))
 
         license_info_nodes = map(self.license_or_special,
                                  snippet.licenses_in_snippet)
-        for lic in license_info_nodes:
-            triple = (
-            snippet_node, self.spdx_namespace.licenseInfoInSnippet, lic)
-            self.graph.add(triple)
+        lic_info_predicate = self.spdx_namespace.licenseInfoInSnippet
+        triples.extend((snippet_node, lic_info_predicate, lic) for lic in license_info_nodes)
 
+        self._emit(triples)
         return snippet_node
 
     def snippets(self):
         """
         Return list of snippet nodes.
         """
-        return map(self.create_snippet_node, self.document.snippet)
+        return list(map(self.create_snippet_node, self.document.snippet))
 
 
 class ReviewInfoWriter(BaseWriter):
@@ -355,6 +411,8 @@ class ReviewInfoWriter(BaseWriter):
     Write spdx.review.Review
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(ReviewInfoWriter, self).__init__(document, out)
 
@@ -362,25 +420,23 @@ class ReviewInfoWriter(BaseWriter):
         """
         Return a review node.
         """
-        review_node = BNode()
-        type_triple = (review_node, RDF.type, self.spdx_namespace.Review)
-        self.graph.add(type_triple)
-
+        review_node = self._bnode()
         reviewer_node = Literal(review.reviewer.to_value())
-        self.graph.add((review_node, self.spdx_namespace.reviewer, reviewer_node))
         reviewed_date_node = Literal(review.review_date_iso_format)
-        reviewed_triple = (review_node, self.spdx_namespace.reviewDate, reviewed_date_node)
-        self.graph.add(reviewed_triple)
+        triples = [
+            (review_node, RDF.type, self.spdx_namespace.Review),
+            (review_node, self.spdx_namespace.reviewer, reviewer_node),
+            (review_node, self.spdx_namespace.reviewDate, reviewed_date_node),
+        ]
         if review.has_comment:
-            comment_node = Literal(review.comment)
-            comment_triple = (review_node, RDFS.comment, comment_node)
-            self.graph.add(comment_triple)
+            triples.append((review_node, RDFS.comment, Literal(review.comment)))
 
+        self._emit(triples)
         return review_node
 
     def reviews(self):
         "Returns a list of review nodes"
-        return map(self.create_review_node, self.document.reviews)
+        return list(map(self.create_review_node, self.document.reviews))
 
 
 class AnnotationInfoWriter(BaseWriter):
@@ -388,6 +444,8 @@ class AnnotationInfoWriter(BaseWriter):
     Write spdx.annotation.Annotation
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(AnnotationInfoWriter, self).__init__(document, out)
 
@@ -396,27 +454,24 @@ class AnnotationInfoWriter(BaseWriter):
         Return an annotation node.
         """
         annotation_node = URIRef(str(annotation.spdx_id))
-        type_triple = (annotation_node, RDF.type, self.spdx_namespace.Annotation)
-        self.graph.add(type_triple)
-
         annotator_node = Literal(annotation.annotator.to_value())
-        self.graph.add((annotation_node, self.spdx_namespace.annotator, annotator_node))
         annotation_date_node = Literal(annotation.annotation_date_iso_format)
-        annotation_triple = (annotation_node, self.spdx_namespace.annotationDate, annotation_date_node)
-        self.graph.add(annotation_triple)
+        triples = [
+            (annotation_node, RDF.type, self.spdx_namespace.Annotation),
+            (annotation_node, self.spdx_namespace.annotator, annotator_node),
+            (annotation_node, self.spdx_namespace.annotationDate, annotation_date_node),
+        ]
         if annotation.has_comment:
-            comment_node = Literal(annotation.comment)
-            comment_triple = (annotation_node, RDFS.comment, comment_node)
-            self.graph.add(comment_triple)
+            triples.append((annotation_node, RDFS.comment, Literal(annotation.comment)))
         annotation_type_node = Literal(annotation.annotation_type)
-        annotation_type_triple = (annotation_node, self.spdx_namespace.annotationType, annotation_type_node)
-        self.graph.add(annotation_type_triple)
+        triples.append((annotation_node, self.spdx_namespace.annotationType, annotation_type_node))
 
+        self._emit(triples)
         return annotation_node
 
     def annotations(self):
         """Returns a list of annotation nodes"""
-        return map(self.create_annotation_node, self.document.annotations)
+        return list(map(self.create_annotation_node, self.document.annotations))
 
 
 class CreationInfoWriter(BaseWriter):
@@ -425,6 +480,8 @@ class CreationInfoWriter(BaseWriter):
     Write class spdx.creationinfo.CreationInfo
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(CreationInfoWriter, self).__init__(document, out)
 
@@ -433,30 +490,28 @@ class CreationInfoWriter(BaseWriter):
         Return a list of creator nodes.
         Note: Does not add anything to the graph.
         """
-        return map(lambda c: Literal(c.to_value()), self.document.creation_info.creators)
+        return list(map(lambda c: Literal(c.to_value()), self.document.creation_info.creators))
 
     def create_creation_info(self):
         """
         Add and return a creation info node to graph
         """
-        ci_node = BNode()
+        ci_node = self._bnode()
         # Type property
-        type_triple = (ci_node, RDF.type, self.spdx_namespace.CreationInfo)
-        self.graph.add(type_triple)
+        triples = [(ci_node, RDF.type, self.spdx_namespace.CreationInfo)]
 
         created_date = Literal(self.document.creation_info.created_iso_format)
-        created_triple = (ci_node, self.spdx_namespace.created, created_date)
-        self.graph.add(created_triple)
+        triples.append((ci_node, self.spdx_namespace.created, created_date))
 
         creators = self.creators()
         for creator in creators:
-            self.graph.add((ci_node, self.spdx_namespace.creator, creator))
+            triples.append((ci_node, self.spdx_namespace.creator, creator))
 
         if self.document.creation_info.has_comment:
             comment_node = Literal(self.document.creation_info.comment)
-            comment_triple = (ci_node, RDFS.comment, comment_node)
-            self.graph.add(comment_triple)
+            triples.append((ci_node, RDFS.comment, comment_node))
 
+        self._emit(triples)
         return ci_node
 
 
@@ -465,6 +520,8 @@ class ExternalDocumentRefWriter(BaseWriter):
     Write class spdx.external_document_ref.ExternalDocumentRef
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(ExternalDocumentRefWriter, self).__init__(document, out)
 
@@ -472,33 +529,26 @@ class ExternalDocumentRefWriter(BaseWriter):
         """
         Add and return a creation info node to graph
         """
-        ext_doc_ref_node = BNode()
-        type_triple = (ext_doc_ref_node, RDF.type, self.spdx_namespace.ExternalDocumentRef)
-        self.graph.add(type_triple)
-
+        ext_doc_ref_node = self._bnode()
         ext_doc_id = Literal(
             ext_document_references.external_document_id)
-        ext_doc_id_triple = (
-            ext_doc_ref_node, self.spdx_namespace.externalDocumentId, ext_doc_id)
-        self.graph.add(ext_doc_id_triple)
-
         doc_uri = Literal(
             ext_document_references.spdx_document_uri)
-        doc_uri_triple = (
-            ext_doc_ref_node, self.spdx_namespace.spdxDocument, doc_uri)
-        self.graph.add(doc_uri_triple)
-
         checksum_node = self.create_checksum_node(
             ext_document_references.check_sum)
-        self.graph.add(
-            (ext_doc_ref_node, self.spdx_namespace.checksum, checksum_node))
+        self._emit([
+            (ext_doc_ref_node, RDF.type, self.spdx_namespace.ExternalDocumentRef),
+            (ext_doc_ref_node, self.spdx_namespace.externalDocumentId, ext_doc_id),
+            (ext_doc_ref_node, self.spdx_namespace.spdxDocument, doc_uri),
+            (ext_doc_ref_node, self.spdx_namespace.checksum, checksum_node),
+        ])
 
         return ext_doc_ref_node
 
     def ext_doc_refs(self):
         "Returns a list of review nodes"
-        return map(self.create_external_document_ref_node,
-                   self.document.ext_document_references)
+        return list(map(self.create_external_document_ref_node,
+                        self.document.ext_document_references))
 
 
 class PackageWriter(LicenseWriter):
@@ -507,6 +557,8 @@ class PackageWriter(LicenseWriter):
     Write spdx.package.Package
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         super(PackageWriter, self).__init__(document, out)
 
@@ -514,91 +566,80 @@ class PackageWriter(LicenseWriter):
         """
         Return a node representing package verification code.
         """
-        verif_node = BNode()
-        type_triple = (verif_node, RDF.type, self.spdx_namespace.PackageVerificationCode)
-        self.graph.add(type_triple)
-        value_triple = (verif_node, self.spdx_namespace.packageVerificationCodeValue, Literal(package.verif_code))
-        self.graph.add(value_triple)
-        excl_file_nodes = map(
-            lambda excl: Literal(excl), package.verif_exc_files)
+        verif_node = self._bnode()
+        triples = [
+            (verif_node, RDF.type, self.spdx_namespace.PackageVerificationCode),
+            (verif_node, self.spdx_namespace.packageVerificationCodeValue, Literal(package.verif_code)),
+        ]
         excl_predicate = self.spdx_namespace.packageVerificationCodeExcludedFile
-        excl_file_triples = [(verif_node, excl_predicate, xcl_file) for xcl_file in excl_file_nodes]
-        for trp in excl_file_triples:
-            self.graph.add(trp)
+        triples.extend((verif_node, excl_predicate, Literal(xcl_file)) for xcl_file in package.verif_exc_files)
+        self._emit(triples)
         return verif_node
 
-    def handle_package_literal_optional(self, package, package_node, predicate, field):
+    def handle_package_literal_optional(self, package, package_node, predicate, field, triples):
         """
         Check if optional field is set.
-        If so it adds the triple (package_node, predicate, $) to the graph.
+        If so it appends the triple (package_node, predicate, $) to triples.
         Where $ is a literal or special value term of the value of the field.
         """
         if package.has_optional_field(field):
             value = getattr(package, field, None)
             value_node = self.to_special_value(value)
-            triple = (package_node, predicate, value_node)
-            self.graph.add(triple)
+            triples.append((package_node, predicate, value_node))
 
-    def handle_pkg_optional_fields(self, package, package_node):
+    def handle_pkg_optional_fields(self, package, package_node, triples):
         """
-        Write package optional fields.
+        Append the triples for the package optional fields to triples.
         """
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.versionInfo, 'version')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.packageFileName, 'file_name')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.supplier, 'supplier')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.originator, 'originator')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.sourceInfo, 'source_info')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.licenseComments, 'license_comment')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.summary, 'summary')
-        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.description, 'description')
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.versionInfo, 'version', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.packageFileName, 'file_name', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.supplier, 'supplier', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.originator, 'originator', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.sourceInfo, 'source_info', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.licenseComments, 'license_comment', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.summary, 'summary', triples)
+        self.handle_package_literal_optional(package, package_node, self.spdx_namespace.description, 'description', triples)
 
         if package.has_optional_field('check_sum'):
             checksum_node = self.create_checksum_node(package.check_sum)
-            self.graph.add((package_node, self.spdx_namespace.checksum, checksum_node))
+            triples.append((package_node, self.spdx_namespace.checksum, checksum_node))
 
         if package.has_optional_field('homepage'):
-            homepage_node = URIRef(self.to_special_value(package.homepage))
-            homepage_triple = (package_node, self.doap_namespace.homepage, homepage_node)
-            self.graph.add(homepage_triple)
+            homepage_node = self._special_values.get(type(package.homepage))
+            if homepage_node is None:
+                homepage_node = URIRef(package.homepage)
+            triples.append((package_node, self.doap_namespace.homepage, homepage_node))
 
     def create_package_node(self, package):
         """
         Return a Node representing the package.
         Files must have been added to the graph before this method is called.
         """
-        package_node = BNode()
-        type_triple = (package_node, RDF.type, self.spdx_namespace.Package)
-        self.graph.add(type_triple)
+        package_node = self._bnode()
+        triples = [(package_node, RDF.type, self.spdx_namespace.Package)]
         # Handle optional fields:
-        self.handle_pkg_optional_fields(package, package_node)
+        self.handle_pkg_optional_fields(package, package_node, triples)
         # package name
-        name_triple = (package_node, self.spdx_namespace.name, Literal(package.name))
-        self.graph.add(name_triple)
+        triples.append((package_node, self.spdx_namespace.name, Literal(package.name)))
         # Package download location
-        down_loc_node = (package_node, self.spdx_namespace.downloadLocation, self.to_special_value(package.download_location))
-        self.graph.add(down_loc_node)
+        triples.append((package_node, self.spdx_namespace.downloadLocation, self.to_special_value(package.download_location)))
         # Handle package verification
         verif_node = self.package_verif_node(package)
-        verif_triple = (package_node, self.spdx_namespace.packageVerificationCode, verif_node)
-        self.graph.add(verif_triple)
+        triples.append((package_node, self.spdx_namespace.packageVerificationCode, verif_node))
         # Handle concluded license
         conc_lic_node = self.license_or_special(package.conc_lics)
-        conc_lic_triple = (package_node, self.spdx_namespace.licenseConcluded, conc_lic_node)
-        self.graph.add(conc_lic_triple)
+        triples.append((package_node, self.spdx_namespace.licenseConcluded, conc_lic_node))
         # Handle declared license
         decl_lic_node = self.license_or_special(package.license_declared)
-        decl_lic_triple = (package_node, self.spdx_namespace.licenseDeclared, decl_lic_node)
-        self.graph.add(decl_lic_triple)
+        triples.append((package_node, self.spdx_namespace.licenseDeclared, decl_lic_node))
         # Package licenses from files
-        licenses_from_files_nodes = map(lambda el: self.license_or_special(el), package.licenses_from_files)
         lic_from_files_predicate = self.spdx_namespace.licenseInfoFromFiles
-        lic_from_files_triples = [(package_node, lic_from_files_predicate, node) for node in licenses_from_files_nodes]
-        for triple in lic_from_files_triples:
-            self.graph.add(triple)
+        licenses_from_files_nodes = map(self.license_or_special, package.licenses_from_files)
+        triples.extend((package_node, lic_from_files_predicate, node) for node in licenses_from_files_nodes)
         # Copyright Text
         cr_text_node = self.to_special_value(package.cr_text)
-        cr_text_triple = (package_node, self.spdx_namespace.copyrightText, cr_text_node)
-        self.graph.add(cr_text_triple)
+        triples.append((package_node, self.spdx_namespace.copyrightText, cr_text_node))
+        self._emit(triples)
         # Handle files
         self.handle_package_has_file(package, package_node)
         return package_node
@@ -616,10 +657,9 @@ class PackageWriter(LicenseWriter):
         Return node representing pkg_file
         pkg_file should be instance of spdx.file.
         """
-        nodes = list(self.graph.triples((None, self.spdx_namespace.fileName, Literal(pkg_file.name))))
-        if len(nodes) == 1:
-            return nodes[0][0]
-        else:
+        try:
+            return self._file_node_by_name[pkg_file.name]
+        except KeyError:
             raise InvalidDocumentError('handle_package_has_file_helper could not' +
                                        ' find file node for file: {0}'.format(pkg_file.name))
 
@@ -629,9 +669,8 @@ class PackageWriter(LicenseWriter):
         Must be called after files have been added.
         """
         file_nodes = map(self.handle_package_has_file_helper, package.files)
-        triples = [(package_node, self.spdx_namespace.hasFile, node) for node in file_nodes]
-        for triple in triples:
-            self.graph.add(triple)
+        has_file_predicate = self.spdx_namespace.hasFile
+        self._emit([(package_node, has_file_predicate, node) for node in file_nodes])
 
 
 class Writer(CreationInfoWriter, ReviewInfoWriter, FileWriter, PackageWriter,
@@ -641,6 +680,8 @@ class Writer(CreationInfoWriter, ReviewInfoWriter, FileWriter, PackageWriter,
     Call `write()` to start writing.
     """
 
+    __slots__ = ()
+
     def __init__(self, document, out):
         """
         - document is spdx.document instance that will be written.
@@ -653,68 +694,84 @@ class Writer(CreationInfoWriter, ReviewInfoWriter, FileWriter, PackageWriter,
         Add and return the root document node to graph.
         """
         doc_node = URIRef('http://www.spdx.org/tools#SPDXRef-DOCUMENT')
-        # Doc type
-        self.graph.add((doc_node, RDF.type, self.spdx_namespace.SpdxDocument))
         # Version
         vers_literal = Literal(str(self.document.version))
-        self.graph.add((doc_node, self.spdx_namespace.specVersion, vers_literal))
         # Data license
         data_lics = URIRef(self.document.data_license.url)
-        self.graph.add((doc_node, self.spdx_namespace.dataLicense, data_lics))
         doc_name = URIRef(self.document.name)
-        self.graph.add((doc_node, self.spdx_namespace.name, doc_name))
+        self._emit([
+            (doc_node, RDF.type, self.spdx_namespace.SpdxDocument),
+            (doc_node, self.spdx_namespace.specVersion, vers_literal),
+            (doc_node, self.spdx_namespace.dataLicense, data_lics),
+            (doc_node, self.spdx_namespace.name, doc_name),
+        ])
         return doc_node
 
-    def write(self):
+    def write(self, canonicalize=False, format='pretty-xml'):
+        """
+        Build the graph and serialize it to `out` in the rdflib `format`.
+        If `canonicalize` is True the graph is relabeled with
+        rdflib.compare.to_isomorphic first so repeated writes of the same
+        document produce the same sort order; this is costly on large
+        documents and not needed for valid output.
+        'nt' output is streamed to `out` as the triples are produced,
+        without building a graph, unless `canonicalize` is set.
+        """
+        streaming = format == 'nt' and not canonicalize
+        if streaming:
+            self.graph = _NTriplesSink(self.out)
         doc_node = self.create_doc()
         # Add creation info
         creation_info_node = self.create_creation_info()
-        ci_triple = (doc_node, self.spdx_namespace.creationInfo, creation_info_node)
-        self.graph.add(ci_triple)
+        triples = [(doc_node, self.spdx_namespace.creationInfo, creation_info_node)]
         # Add review info
         review_nodes = self.reviews()
         for review in review_nodes:
-            self.graph.add((doc_node, self.spdx_namespace.reviewed, review))
+            triples.append((doc_node, self.spdx_namespace.reviewed, review))
         # Add external document references info
         ext_doc_ref_nodes = self.ext_doc_refs()
         for ext_doc_ref in ext_doc_ref_nodes:
-            ext_doc_ref_triple = (doc_node,
-                                  self.spdx_namespace.externalDocumentRef,
-                                  ext_doc_ref)
-            self.graph.add(ext_doc_ref_triple)
+            triples.append((doc_node,
+                            self.spdx_namespace.externalDocumentRef,
+                            ext_doc_ref))
         # Add extracted licenses
         licenses = map(
             self.create_extracted_license, self.document.extracted_licenses)
         for lic in licenses:
-            self.graph.add((doc_node, self.spdx_namespace.hasExtractedLicensingInfo, lic))
+            triples.append((doc_node, self.spdx_namespace.hasExtractedLicensingInfo, lic))
         # Add files
         files = self.files()
-        for file_node in files:
-            self.graph.add((doc_node, self.spdx_namespace.referencesFile, file_node))
+        references_predicate = self.spdx_namespace.referencesFile
+        triples.extend((doc_node, references_predicate, file_node) for file_node in files)
         self.add_file_dependencies()
         # Add package
         package_node = self.packages()
-        package_triple = (doc_node, self.spdx_namespace.describesPackage, package_node)
-        self.graph.add(package_triple)
+        triples.append((doc_node, self.spdx_namespace.describesPackage, package_node))
         # Add snippet
         snippet_nodes = self.snippets()
         for snippet in snippet_nodes:
-            self.graph.add((doc_node, self.spdx_namespace.Snippet, snippet))
+            triples.append((doc_node, self.spdx_namespace.Snippet, snippet))
+        self._emit(triples)
+        if streaming:
+            return
 
-        # normalize the graph to ensure that the sort order is stable
-        self.graph = to_isomorphic(self.graph)
+        if canonicalize:
+            # normalize the graph to ensure that the sort order is stable
+            self.graph = to_isomorphic(self.graph)
 
         # Write file
-        self.graph.serialize(self.out, 'pretty-xml', encoding='utf-8')
+        self.graph.serialize(self.out, format, encoding='utf-8')
 
 
-def write_document(document, out, validate=True):
+def write_document(document, out, validate=True, canonicalize=False, format='pretty-xml'):
     """
     Write an SPDX RDF document.
     - document - spdx.document instance.
     - out - file like object that will be written to.
     Optionally `validate` the document before writing and raise
     InvalidDocumentError if document.validate returns False.
+    Pass `canonicalize` to get a stable triple order and `format` to pick
+    another rdflib serializer, e.g. 'xml' or 'nt' (see Writer.write).
     """
     
     if validate:
@@ -724,4 +781,4 @@ def write_document(document, out, validate=True):
             raise InvalidDocumentError(messages)
 
     writer = Writer(document, out)
-    writer.write()
+    writer.write(canonicalize=canonicalize, format=format)
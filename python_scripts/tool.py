@@ -2,10 +2,7 @@ import sys, os, logging
 import argparse
 import subprocess
 
-from utils import get_dependencies
-
-import core
-import helpers
+from utils import get_dependencies, HashCache, use_hash_cache
 
 
 def build_parser(args):
@@ -15,11 +12,18 @@ def build_parser(args):
         "tv": True if "--tv" in args else False,
         "rdf": True if "--rdf" in args else False,
         "res": True if "--res" in args else False,
+        "hash_cache": True if "--hash-cache" in args else False,
     }
     return arguments
 
 
 def create_spdx_document(args):
+    # imported here so that importing tool does not load the SPDX writers
+    import core
+    import helpers
+
+    hash_cache = HashCache() if args["hash_cache"] else None
+    use_hash_cache(hash_cache)
     deps = get_dependencies(args)
     glob_to_skip = []
     file_types = "tv"
@@ -29,6 +33,8 @@ def create_spdx_document(args):
         args["project_path"], args["spdx_file_name"], all_identifiers, True, file_types
     )
     spdx_file.create_spdx_document()
+    if hash_cache is not None:
+        hash_cache.save()
 
 
 def main(argv):
@@ -37,4 +43,5 @@ def main(argv):
     create_spdx_document(args)
 
 
-main(sys.argv)
+if __name__ == "__main__":
+    main(sys.argv)
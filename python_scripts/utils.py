@@ -1,18 +1,29 @@
 import os, sys, logging
+import functools
 import hashlib
-from distutils.sysconfig import get_python_lib
+import mmap
+import re
+import sqlite3
+import sysconfig
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # filenames to ignore altogether, and not include in reports
-IGNORE_FILENAMES = [".DS_Store", "INSTALLER"]
+IGNORE_FILENAMES = frozenset([".DS_Store", "INSTALLER"])
 
 # extensions to report on, but skip scanning
-SKIP_EXTENSIONS = [".gif", ".png", ".jpg", ".PNG", ".pdf", ".der", ".bin"]
+SKIP_EXTENSIONS = frozenset(
+    [".gif", ".png", ".jpg", ".PNG", ".pdf", ".der", ".bin"]
+)
 
 # directories whose files should be reported on, but skip scanning
-SKIP_DIRECTORIES = ["LICENSES", ".git"]
+SKIP_DIRECTORIES = frozenset(["LICENSES", ".git"])
 
 # directories whose files should not be reported on and not scanned
-HIDE_DIRECTORIES = ["LICENSES", ".git"]
+HIDE_DIRECTORIES = frozenset(["LICENSES", ".git"])
+
+# site-packages directory whose entries get_dependencies reports
+PYTHON_LIB = sysconfig.get_paths()["purelib"]
 
 # Suffix used to guarantee uniqueness of spdx filename
 FILE_SUFFIX = "spdx"
@@ -30,13 +41,19 @@ CODEBASE_EXTRA_PARAMS = {
     "lic_identifier": "CC0-1.0",
 }
 
-FILES_TO_EXCLUDE = ["VERSION", "LICENSE"]
+FILES_TO_EXCLUDE = frozenset(["VERSION", "LICENSE"])
+
+# matches paths containing any of FILES_TO_EXCLUDE
+FILES_TO_EXCLUDE_RE = re.compile(
+    "|".join(re.escape(f) for f in sorted(FILES_TO_EXCLUDE))
+)
 
 # TAG VALUE or RDF
 TAG_VALUE = "tv"
 RDF = "rdf"
 
 
+@functools.lru_cache(maxsize=4096)
 def is_dir(path):
     """
     Returns True if the path is that of a directory; and False otherwise
@@ -44,6 +61,7 @@ def is_dir(path):
     return os.path.isdir(path)
 
 
+@functools.lru_cache(maxsize=4096)
 def is_file(path):
     """
     Returns True if the path is that of a file; and False otherwise
@@ -51,24 +69,66 @@ def is_file(path):
     return os.path.isfile(path)
 
 
-def get_file_hash(file_path):
+# Number of files hashed per thread pool task, see get_file_hashes
+HASH_BATCH_SIZE = 64
+
+
+def _get_file_hash_batch(file_paths):
+    return [get_file_hash(file_path) for file_path in file_paths]
+
+
+def get_file_hashes(file_paths):
+    """
+    Return the SHA1 hex digests of file_paths, in the same order.
+    Files are hashed concurrently since hashlib releases the GIL.
+    """
+    # ThreadPoolExecutor.map ignores chunksize, so batch the paths by hand
+    # rather than paying for a future per file
+    batches = [
+        file_paths[i : i + HASH_BATCH_SIZE]
+        for i in range(0, len(file_paths), HASH_BATCH_SIZE)
+    ]
+    file_hashes = []
+    with ThreadPoolExecutor() as executor:
+        for batch_hashes in executor.map(_get_file_hash_batch, batches):
+            file_hashes.extend(batch_hashes)
+    return file_hashes
+
+
+def get_dir_hash(dir_path):
+    """
+    Return a SHA1 hex digest for all files in dir_path, identical to
+    checksumdir.dirhash(dir_path, "sha1") but hashing files concurrently.
+    """
+    file_paths = []
+    missing_files = 0
+    stack = [dir_path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # like os.walk, symlinked directories are listed but not followed
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif not entry.is_symlink() or os.path.exists(entry.path):
+                    file_paths.append(entry.path)
+                else:
+                    # dangling symlinks hash as empty files
+                    missing_files += 1
+    hashvalues = get_file_hashes(file_paths)
+    hashvalues.extend([hashlib.sha1().hexdigest()] * missing_files)
     sha1sum = hashlib.sha1()
-    with open(file_path, "rb") as source:
-        block = source.read(2 ** 16)
-        while len(block) != 0:
-            sha1sum.update(block)
-            block = source.read(2 ** 16)
+    for hashvalue in sorted(hashvalues):
+        sha1sum.update(hashvalue.encode("utf-8"))
     return sha1sum.hexdigest()
 
 
 def should_skip_file(file_path, output_file):
-    should_skip = False
-    for item in FILES_TO_EXCLUDE:
-        if item in file_path:
-            should_skip = True
-    if output_file in file_path:
-        should_skip = True
-    return should_skip
+    return output_file in file_path or FILES_TO_EXCLUDE_RE.search(file_path) is not None
 
 
 def get_codebase_extra_params(path_or_file):
@@ -76,40 +136,146 @@ def get_codebase_extra_params(path_or_file):
 
 
 def get_package_file(dir_or_file, file_name):
-    if is_dir(dir_or_file):
-        version_file_path = os.path.join(dir_or_file, file_name)
-        if os.path.exists(version_file_path):
-            return version_file_path
+    # one stat: the join can only name a regular file if dir_or_file is a directory
+    version_file_path = os.path.join(dir_or_file, file_name)
+    if os.path.isfile(version_file_path):
+        return version_file_path
     return None
 
 
+# "VERSION_MAJOR = 1" style lines of a VERSION file; the value ends at the
+# next "=" or end of line
+VERSION_FIELD_RE = re.compile(r"(VERSION_MAJOR|VERSION_MINOR)[^=\n]*=([^=\n]*)")
+
+
 def get_package_version(path_or_file):
     version_file = get_package_file(path_or_file, "VERSION")
-    version_major = None
-    version_minor = None
     if version_file:
-        version_file_content = open(version_file, "r")
-        for line in version_file_content:
-            if "VERSION_MAJOR" in line:
-                version_major = line.split("=")[1]
-            if "VERSION_MINOR" in line:
-                version_minor = line.split("=")[1]
+        with open(version_file, "r") as f:
+            # later lines override earlier ones
+            fields = dict(VERSION_FIELD_RE.findall(f.read()))
+        version_major = fields.get("VERSION_MAJOR", "").strip()
+        version_minor = fields.get("VERSION_MINOR", "").strip()
         if version_major and version_minor:
-            return "{0}.{1}".format(
-                version_major.strip(" ").strip("\n"),
-                version_minor.strip(" ").strip("\n"),
-            )
+            return "{0}.{1}".format(version_major, version_minor)
     return None
 
 
+# Read size for hashing; files no larger than this are hashed from one read
+HASH_BLOCK_SIZE = 2 ** 16
+
+# Files at least this large are memory-mapped and hashed in one update
+HASH_MMAP_SIZE = 2 ** 20
+
+# Hashing is left entirely to hashlib, which runs OpenSSL's SHA1 over whole
+# buffers without holding the GIL. Do not move it into a Python-level chunk
+# loop or JIT it with Numba: Numba handles bytes more slowly than CPython
+# does and cannot call into OpenSSL.
+
+
+@functools.lru_cache(maxsize=None)
+def _get_file_hash(file_path, mtime_ns, size):
+    # unbuffered: every read goes straight into our buffer, not a copy of it
+    with open(file_path, "rb", buffering=0) as source:
+        if size <= HASH_BLOCK_SIZE:
+            return hashlib.sha1(source.read()).hexdigest()
+        if size < HASH_MMAP_SIZE and hasattr(hashlib, "file_digest"):
+            # Python 3.11+
+            return hashlib.file_digest(source, "sha1").hexdigest()
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha1(mapped).hexdigest()
+
+
+# Default location of the persistent digest cache, see HashCache
+HASH_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "spdx-npm-build-tool", "hashes.db"
+)
+
+
+class HashCache(object):
+    """
+    SHA1 digests kept across runs in an sqlite database, one row per
+    (st_dev, st_ino). A row is only used while the file still has the
+    recorded size and st_mtime_ns, so changed files are rehashed.
+    Entries added during the run are written back by save().
+    """
+
+    def __init__(self, path=HASH_CACHE_PATH):
+        self.path = path
+        self.digests = {}
+        self.added = {}
+        self.lock = threading.Lock()
+        if os.path.exists(path):
+            with sqlite3.connect(path) as db:
+                self._create_table(db)
+                for dev, ino, size, mtime_ns, digest in db.execute(
+                    "SELECT dev, ino, size, mtime_ns, sha1 FROM hashes"
+                ):
+                    self.digests[(dev, ino)] = (size, mtime_ns, digest)
+
+    @staticmethod
+    def _create_table(db):
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS hashes (dev INTEGER, ino INTEGER,"
+            " size INTEGER, mtime_ns INTEGER, sha1 TEXT, PRIMARY KEY (dev, ino))"
+        )
+
+    def get(self, stat):
+        entry = self.digests.get((stat.st_dev, stat.st_ino))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def put(self, stat, digest):
+        entry = (stat.st_size, stat.st_mtime_ns, digest)
+        with self.lock:
+            self.digests[(stat.st_dev, stat.st_ino)] = entry
+            self.added[(stat.st_dev, stat.st_ino)] = entry
+
+    def save(self):
+        with self.lock:
+            rows = [key + entry for key, entry in self.added.items()]
+            self.added = {}
+        if not rows:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with sqlite3.connect(self.path) as db:
+            self._create_table(db)
+            db.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)", rows)
+
+
+# HashCache consulted by get_file_hash, if any; see use_hash_cache
+_hash_cache = None
+
+
+def use_hash_cache(cache):
+    """
+    Make get_file_hash look digests up in, and add them to, the HashCache
+    cache; None turns the persistent cache off again.
+    """
+    global _hash_cache
+    _hash_cache = cache
+
+
 def get_file_hash(file_path):
-    sha1sum = hashlib.sha1()
-    with open(file_path, "rb") as source:
-        block = source.read(2 ** 16)
-        while len(block) != 0:
-            sha1sum.update(block)
-            block = source.read(2 ** 16)
-    return sha1sum.hexdigest()
+    """
+    Return the SHA1 hex digest of file_path. Digests are memoized for the run,
+    keyed on modification time and size so that changed files are rehashed,
+    and come from the persistent HashCache when one is in use.
+    """
+    stat = os.stat(file_path)
+    cache = _hash_cache
+    if cache is not None:
+        digest = cache.get(stat)
+        if digest is None:
+            digest = _get_file_hash(
+                os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+            )
+            cache.put(stat, digest)
+        return digest
+    return _get_file_hash(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
 
 
 def read(filename):
@@ -130,29 +296,30 @@ def get_virtual_env_dir():
     return None
 
 
+# "major.minor" of the running interpreter
+PYTHON_VERSION = "{0}.{1}".format(*sys.version_info[:2])
+
+
 def get_python_version():
-    return sys.version[:3]
+    return PYTHON_VERSION
 
 
 def get_dependencies(args):
     """
     Get python dependencies from virtualenv.
     If they are not available(user uses another virtualenv), download them to temp folder.
+    Yields the project path, then an os.DirEntry per site-packages entry as it
+    is listed, so the file walk can start before the listing is done.
     """
     logging.basicConfig(level=logging.INFO)
     logging.info("Getting dependencies")
-    project_path = os.path.expanduser(args["project_path"])
+    yield os.path.expanduser(args["project_path"])
     reserved_python_names = args["res"]
-    short_dep_list = os.listdir(get_python_lib())
-    dep_list = [project_path]
-    if not reserved_python_names:
-        final_dep_list = []
-        for item in short_dep_list:
-            if not item.startswith("__") and not item.endswith("__"):
-                final_dep_list.append(item)
-        for item in final_dep_list:
-            dep_list.append(os.path.join(get_python_lib(), item))
-    else:
-        for item in short_dep_list:
-            dep_list.append(os.path.join(get_python_lib(), item))
-    return dep_list
+    with os.scandir(PYTHON_LIB) as entries:
+        for entry in entries:
+            name = entry.name
+            if reserved_python_names or not (
+                name.startswith("__") or name.endswith("__")
+            ):
+                # the DirEntry spares get_dependencies_file_paths a stat
+                yield entry